@@ -32,5 +32,5 @@ __all__ = [
     'validate_object_id', 'validate_numeric_range', 'validate_list_items',
     'validate_json_schema', 'sanitize_string', 'validate_task_priority',
     'validate_task_status', 'validate_password', 'validate_file_type',
-    'validate_file_size', 'EMAIL_REGEX', 'URL_REGEX', 'PRIORITY_VALUES', 'STATUS_VALUES'
+    'validate_file_size', 'validate_status_path', 'EMAIL_REGEX', 'URL_REGEX', 'PRIORITY_VALUES', 'STATUS_VALUES'
 ]
\ No newline at end of file
@@ -5,6 +5,7 @@ Implements comprehensive input validation for various entities including tasks,
 
 import re
 import typing
+from collections import deque
 from datetime import datetime
 import bson
 from typing import Dict, List, Optional, Any, Union
@@ -386,6 +387,49 @@ def validate_project_status_transition(current_status: str, new_status: str) ->
     return True
 
 
+def validate_status_path(current_status: str, target_status: str,
+                         transitions: Dict[str, List[str]]) -> List[str]:
+    """
+    Finds the shortest chain of allowed transitions from one status to another.
+    
+    Args:
+        current_status: The status to start from
+        target_status: The status to reach
+        transitions: Mapping of each status to the statuses it may move to
+        
+    Returns:
+        Ordered list of statuses to apply, excluding current_status
+        (empty if current_status already equals target_status)
+        
+    Raises:
+        ValidationError: If target_status cannot be reached from current_status
+    """
+    # Breadth-first search so the first path found is the shortest
+    previous = {current_status: None}
+    queue = deque([current_status])
+    while queue and target_status not in previous:
+        status = queue.popleft()
+        for next_status in transitions.get(status, []):
+            if next_status not in previous:
+                previous[next_status] = status
+                queue.append(next_status)
+    
+    if target_status not in previous:
+        raise ValidationError(
+            "Invalid status transition", 
+            {"status": f"Cannot transition from '{current_status}' to '{target_status}'"}
+        )
+    
+    # Walk back from the target to rebuild the path
+    path = []
+    status = target_status
+    while status != current_status:
+        path.append(status)
+        status = previous[status]
+    
+    return path[::-1]
+
+
 def validate_task(task_data: Dict[str, Any], is_update: bool = False) -> bool:
     """
     Comprehensive validation for task data.
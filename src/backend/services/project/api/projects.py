@@ -65,6 +65,31 @@ def create_project():
         return jsonify({"message": "Internal server error"}), 500
 
 
+@projects_bp.route('/bulk', methods=['POST'])
+@token_required
+def create_projects_bulk():
+    """Endpoint to create several projects in one request"""
+    try:
+        # Get current authenticated user from context
+        user_id = get_current_user()['user_id']
+
+        # Extract the list of projects from request JSON
+        projects_data = (request.get_json() or {}).get('projects')
+
+        # Call project_service.create_projects_bulk with the list and user_id
+        projects = project_service.create_projects_bulk(projects_data, user_id)
+
+        # Return created projects, in request order, with 201 status code
+        return jsonify(projects), 201
+    except ValidationError as e:
+        return handle_validation_error(e)
+    except AuthorizationError as e:
+        return handle_authorization_error(e)
+    except Exception:
+        logger.exception("Unexpected error bulk creating projects")
+        return jsonify({"message": "Internal server error"}), 500
+
+
 @projects_bp.route('', methods=['GET'])
 @token_required
 def get_projects():
@@ -165,6 +190,33 @@ def delete_project(project_id):
         return jsonify({"message": "Internal server error"}), 500
 
 
+@projects_bp.route('/bulk-delete', methods=['POST'])
+@token_required
+def delete_projects_bulk():
+    """Endpoint to delete (archive) several projects in one request"""
+    try:
+        # Get current authenticated user from context
+        user_id = get_current_user()['user_id']
+
+        # Extract the list of project IDs from request JSON
+        project_ids = (request.get_json() or {}).get('ids')
+
+        # Call project_service.delete_projects_bulk with the IDs and user_id
+        deleted = project_service.delete_projects_bulk(project_ids, user_id)
+
+        # Return success message and number of deleted projects with 200 status code
+        return jsonify({"message": "Projects deleted successfully", "deleted": deleted}), 200
+    except ValidationError as e:
+        return handle_validation_error(e)
+    except NotFoundError as e:
+        return handle_not_found_error(e)
+    except AuthorizationError as e:
+        return handle_authorization_error(e)
+    except Exception:
+        logger.exception("Unexpected error bulk deleting projects")
+        return jsonify({"message": "Internal server error"}), 500
+
+
 @projects_bp.route('/search', methods=['GET'])
 @token_required
 def search_projects():
@@ -24,7 +24,7 @@ from ../../../common/database/mongo/models import (
 from ../../../common/database/mongo/connection import get_db
 from ../../../common/utils/datetime import now
 from ../../../common/utils/validators import (
-    validate_required, validate_string_length, validate_enum
+    validate_required, validate_string_length, validate_enum, validate_status_path
 )
 from ../../../common/events/event_bus import get_event_bus_instance, create_event
 from ../../../common/logging/logger import get_logger
@@ -355,6 +355,35 @@ class Project(Document):
         
         return self
     
+    def advance_status(self, target_status: str) -> 'Project':
+        """
+        Moves the project to a target status through the shortest chain of allowed transitions.
+        
+        Used when a project is created directly in a later workflow state, so that side
+        effects of intermediate transitions (such as completedAt) are still applied.
+        
+        Args:
+            target_status: The status to reach
+            
+        Returns:
+            Self with updated status
+            
+        Raises:
+            ValidationError: If the target status is invalid or cannot be reached
+        """
+        # Validate that target_status is a valid status
+        if target_status not in PROJECT_STATUS_CHOICES:
+            raise ValidationError(
+                "Invalid project status",
+                {"status": f"Status must be one of: {', '.join(PROJECT_STATUS_CHOICES)}"}
+            )
+        
+        # Apply each step of the shortest allowed path through update_status
+        for status in validate_status_path(self.get("status"), target_status, STATUS_TRANSITIONS):
+            self.update_status(status)
+        
+        return self
+    
     def add_task_list(self, name: str, description: str = "") -> Dict:
         """
         Adds a new task list to the project.
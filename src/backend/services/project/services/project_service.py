@@ -17,6 +17,7 @@ import requests  # 2.28.x
 from src.backend.services.project.models.project import (
     Project,
     PROJECT_STATUS_CHOICES,
+    STATUS_TRANSITIONS,
     get_project_by_id,
 )  # Project model and related project retrieval function
 from src.backend.services.project.services.member_service import (
@@ -49,6 +50,8 @@ from src.backend.common.logging.logger import get_logger  # Logging functionalit
 from src.backend.common.utils.validators import (
     validate_object_id,
     validate_required,
+    validate_enum,
+    validate_status_path,
 )  # Input validation utilities
 from src.backend.common.utils.datetime import utcnow  # Datetime utility for timestamps
 
@@ -58,6 +61,12 @@ logger = get_logger(__name__)
 # Get event bus
 event_bus = get_event_bus_instance()
 
+# Maximum number of projects accepted by a single bulk create request
+MAX_BULK_PROJECTS = 100
+
+# Statuses a project may be created in; 'archived' marks a deleted project
+INITIAL_STATUS_CHOICES = [status for status in PROJECT_STATUS_CHOICES if status != "archived"]
+
 
 class ProjectService:
     """
@@ -104,11 +113,13 @@ class ProjectService:
         }
         project_data["owner_id"] = ObjectId(user_id)
 
-        # Set default status to 'planning'
+        # New projects start in 'planning' and are walked to the requested status, if any
+        initial_status = self._validate_initial_status(project_data)
         project_data["status"] = "planning"
 
         # Create new Project instance
         project = Project(data=project_data)
+        project.advance_status(initial_status)
 
         # Save project to database
         project.save()
@@ -137,6 +148,55 @@ class ProjectService:
         # Return created project as dictionary
         return project.to_dict()
 
+    def create_projects_bulk(self, projects_data: List[Dict], user_id: str) -> List[Dict]:
+        """
+        Creates several projects in a single call
+
+        Args:
+            projects_data (list): List of project data dictionaries
+            user_id (str): ID of the user creating the projects
+
+        Returns:
+            list: Created projects, in the same order as projects_data
+        """
+        # Validate the batch itself
+        if not isinstance(projects_data, list) or not projects_data:
+            raise ValidationError(message="Invalid bulk request", errors={"projects": "Must be a non-empty list"})
+        if len(projects_data) > MAX_BULK_PROJECTS:
+            raise ValidationError(
+                message="Invalid bulk request",
+                errors={"projects": f"At most {MAX_BULK_PROJECTS} projects can be created at once"},
+            )
+
+        # Validate every entry before creating anything, including its status,
+        # so no partial batch is left behind
+        for project_data in projects_data:
+            if not isinstance(project_data, dict):
+                raise ValidationError(message="Invalid bulk request", errors={"projects": "Every entry must be an object"})
+            validate_required(project_data, ["name", "description"])
+            self._validate_initial_status(project_data)
+
+        # Create projects in request order
+        return [self.create_project(project_data, user_id) for project_data in projects_data]
+
+    def _validate_initial_status(self, project_data: Dict) -> str:
+        """
+        Validates the status a new project is requested in
+
+        Args:
+            project_data (dict): Project data
+
+        Returns:
+            str: The requested status, 'planning' if none was given
+        """
+        initial_status = project_data.get("status") or "planning"
+
+        # The status must exist, must not be 'archived' and must be reachable from 'planning'
+        validate_enum(initial_status, INITIAL_STATUS_CHOICES, "status")
+        validate_status_path("planning", initial_status, STATUS_TRANSITIONS)
+
+        return initial_status
+
     def get_project(self, project_id: str, user_id: str) -> Dict:
         """
         Retrieves a project by its ID
@@ -239,6 +299,26 @@ class ProjectService:
         Returns:
             bool: True if project was successfully deleted
         """
+        # Get the project, checking it exists and the user may delete it
+        project = self._get_deletable_project(project_id, user_id)
+
+        # Archive the project
+        self._archive_project(project, project_id)
+
+        # Return success status (True)
+        return True
+
+    def _get_deletable_project(self, project_id: str, user_id: str) -> Project:
+        """
+        Retrieves a project the user is allowed to delete
+
+        Args:
+            project_id (str): ID of the project
+            user_id (str): ID of the user deleting the project
+
+        Returns:
+            Project: The project to delete
+        """
         # Validate project_id format
         validate_object_id(project_id, "project_id")
 
@@ -253,6 +333,16 @@ class ProjectService:
         if not has_permission({"id": user_id}, "project:delete", project._data):
             raise AuthorizationError(message="You do not have permission to delete this project")
 
+        return project
+
+    def _archive_project(self, project: Project, project_id: str) -> None:
+        """
+        Soft deletes a project by setting status to 'archived' and publishes project.deleted
+
+        Args:
+            project (Project): Project to archive
+            project_id (str): ID of the project
+        """
         # Change project status to 'archived'
         project._data["status"] = "archived"
 
@@ -273,8 +363,40 @@ class ProjectService:
         # Log project deletion
         logger.info(f"Project deleted with ID: {project_id}")
 
-        # Return success status (True)
-        return True
+    def delete_projects_bulk(self, project_ids: List[str], user_id: str) -> int:
+        """
+        Soft deletes several projects in a single call
+
+        Args:
+            project_ids (list): IDs of the projects to delete
+            user_id (str): ID of the user deleting the projects
+
+        Returns:
+            int: Number of projects deleted
+        """
+        # Validate the batch itself
+        if not isinstance(project_ids, list) or not project_ids:
+            raise ValidationError(message="Invalid bulk request", errors={"ids": "Must be a non-empty list"})
+        if len(project_ids) > MAX_BULK_PROJECTS:
+            raise ValidationError(
+                message="Invalid bulk request",
+                errors={"ids": f"At most {MAX_BULK_PROJECTS} projects can be deleted at once"},
+            )
+
+        if not all(isinstance(project_id, str) for project_id in project_ids):
+            raise ValidationError(message="Invalid bulk request", errors={"ids": "Every ID must be a string"})
+
+        # Drop repeated IDs, keeping request order, so each project is archived and counted once
+        project_ids = list(dict.fromkeys(project_ids))
+
+        # Check that every project exists and may be deleted before archiving
+        # anything, so a bad ID does not leave part of the batch deleted
+        projects = [self._get_deletable_project(project_id, user_id) for project_id in project_ids]
+
+        # Archive projects in request order
+        for project, project_id in zip(projects, project_ids):
+            self._archive_project(project, project_id)
+        return len(project_ids)
 
     def list_projects(self, user_id: str, filters: Dict, page: int, per_page: int) -> Dict:
         """
@@ -58,6 +58,91 @@ def test_create_project_validation_error(projects_api_client):
     # (Verification depends on how the database is mocked)
 
 
+def test_create_project_with_initial_status(projects_api_client, project_data):
+    """Test project creation honors a requested initial status"""
+    # Request a status that needs planning -> active -> completed
+    project_data["status"] = "completed"
+
+    # Make POST request to /api/v1/projects with the status in the body
+    response = projects_api_client.post("/api/v1/projects", json=project_data)
+
+    # Assert the project was created directly in the requested status
+    assert response.status_code == 201
+    response_data = response.get_json()
+    assert response_data["status"] == "completed"
+    assert "completedAt" in response_data["metadata"]
+
+
+def test_create_project_archived_initial_status(projects_api_client, project_data):
+    """Test project creation rejects 'archived', which would create a deleted project"""
+    project_data["status"] = "archived"
+
+    # Make POST request to /api/v1/projects with the status in the body
+    response = projects_api_client.post("/api/v1/projects", json=project_data)
+
+    # Assert response status code is 400 (Bad Request)
+    assert response.status_code == 400
+    assert "status" in response.get_json()["errors"]
+
+
+def test_create_projects_bulk_success(projects_api_client, project_data):
+    """Test bulk project creation returns the created projects in request order"""
+    # Build several projects with different statuses
+    statuses = ["planning", "active", "on_hold"]
+    projects = [
+        {**project_data, "name": f"Bulk Project {index}", "status": status}
+        for index, status in enumerate(statuses)
+    ]
+
+    # Make POST request to /api/v1/projects/bulk
+    response = projects_api_client.post("/api/v1/projects/bulk", json={"projects": projects})
+
+    # Assert response status code is 201 (Created)
+    assert response.status_code == 201
+
+    # Assert order and statuses are preserved
+    response_data = response.get_json()
+    assert [p["name"] for p in response_data] == [p["name"] for p in projects]
+    assert [p["status"] for p in response_data] == statuses
+
+
+def test_create_projects_bulk_validation_error(projects_api_client, project_data):
+    """Test bulk project creation rejects the batch if any entry is invalid"""
+    # Second project is missing its name
+    projects = [project_data, {"description": "Project without name"}]
+
+    # Make POST request to /api/v1/projects/bulk
+    response = projects_api_client.post("/api/v1/projects/bulk", json={"projects": projects})
+
+    # Assert response status code is 400 (Bad Request)
+    assert response.status_code == 400
+    assert "name" in response.get_json()["errors"]
+
+
+@pytest.mark.parametrize("status", ["unknown", "archived"])
+def test_create_projects_bulk_invalid_status(projects_api_client, project_data, status):
+    """Test bulk project creation rejects the batch if any entry has an invalid status"""
+    # Second project requests a status projects cannot be created in
+    projects = [project_data, {**project_data, "name": "Bad Status Project", "status": status}]
+
+    # Make POST request to /api/v1/projects/bulk
+    response = projects_api_client.post("/api/v1/projects/bulk", json={"projects": projects})
+
+    # Assert response status code is 400 (Bad Request)
+    assert response.status_code == 400
+    assert "status" in response.get_json()["errors"]
+
+
+def test_create_projects_bulk_non_object_entry(projects_api_client, project_data):
+    """Test bulk project creation rejects entries that are not objects"""
+    # Make POST request to /api/v1/projects/bulk with a number in the list
+    response = projects_api_client.post("/api/v1/projects/bulk", json={"projects": [project_data, 1]})
+
+    # Assert response status code is 400 (Bad Request)
+    assert response.status_code == 400
+    assert "projects" in response.get_json()["errors"]
+
+
 def test_get_project_success(projects_api_client, test_project):
     """Test successful retrieval of a project by ID"""
     # Make GET request to /api/v1/projects/{project_id}
@@ -259,6 +344,72 @@ def test_delete_project_not_found(projects_api_client):
     assert "Project not found" in response_data["message"]
 
 
+def test_delete_projects_bulk_success(projects_api_client, test_project, mock_event_bus):
+    """Test bulk project deletion archives every listed project"""
+    # Make POST request to /api/v1/projects/bulk-delete
+    response = projects_api_client.post(
+        "/api/v1/projects/bulk-delete", json={"ids": [test_project.get_id_str()]}
+    )
+
+    # Assert response status code is 200 (OK)
+    assert response.status_code == 200
+
+    # Assert response reports the number of deleted projects
+    response_data = response.get_json()
+    assert response_data["deleted"] == 1
+
+    # Assert event_bus.publish was called with project.deleted event
+    mock_event_bus.publish.assert_called_with("project.deleted", mock.ANY)
+
+
+def test_delete_projects_bulk_duplicate_ids(projects_api_client, test_project):
+    """Test bulk project deletion counts a repeated project ID once"""
+    project_id = test_project.get_id_str()
+
+    # Make POST request to /api/v1/projects/bulk-delete listing the project twice
+    response = projects_api_client.post("/api/v1/projects/bulk-delete", json={"ids": [project_id, project_id]})
+
+    # Assert the project was deleted and counted once
+    assert response.status_code == 200
+    assert response.get_json()["deleted"] == 1
+
+
+def test_delete_projects_bulk_non_string_id(projects_api_client):
+    """Test bulk project deletion rejects IDs that are not strings"""
+    # Make POST request to /api/v1/projects/bulk-delete with a number as ID
+    response = projects_api_client.post("/api/v1/projects/bulk-delete", json={"ids": [1]})
+
+    # Assert response status code is 400 (Bad Request)
+    assert response.status_code == 400
+    assert "ids" in response.get_json()["errors"]
+
+
+def test_delete_projects_bulk_not_found(projects_api_client, test_project):
+    """Test bulk project deletion archives nothing if any project does not exist"""
+    # Second ID does not belong to any project
+    ids = [test_project.get_id_str(), "60d1b7e9a7b3c40000d4e2f0"]
+
+    # Make POST request to /api/v1/projects/bulk-delete
+    response = projects_api_client.post("/api/v1/projects/bulk-delete", json={"ids": ids})
+
+    # Assert response status code is 404 (Not Found)
+    assert response.status_code == 404
+
+    # Assert the existing project was left untouched
+    response = projects_api_client.get(f"/api/v1/projects/{test_project.get_id_str()}")
+    assert response.get_json()["status"] != "archived"
+
+
+def test_delete_projects_bulk_validation_error(projects_api_client):
+    """Test bulk project deletion rejects an empty ID list"""
+    # Make POST request to /api/v1/projects/bulk-delete
+    response = projects_api_client.post("/api/v1/projects/bulk-delete", json={"ids": []})
+
+    # Assert response status code is 400 (Bad Request)
+    assert response.status_code == 400
+    assert "ids" in response.get_json()["errors"]
+
+
 def test_add_task_list_success(projects_api_client, test_project, mock_event_bus):
     """Test successfully adding a task list to a project"""
     # Create task list data with name and description
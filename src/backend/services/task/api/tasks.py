@@ -118,6 +118,51 @@ def create_task():
         return jsonify({"message": "Internal server error"}), 500
 
 
+@tasks_bp.route('/bulk', methods=['POST'])
+@token_required
+@permission_required('create_task')
+def create_tasks_bulk():
+    """Route handler for creating several tasks in one request"""
+    try:
+        # Extract the list of tasks and optional shared projectId from request JSON
+        payload = request.get_json() or {}
+        tasks_data = payload.get('tasks')
+
+        # Apply the shared projectId to tasks that do not set their own
+        if payload.get('projectId') and isinstance(tasks_data, list):
+            tasks_data = [
+                {'projectId': payload['projectId'], **task_data} if isinstance(task_data, dict) else task_data
+                for task_data in tasks_data
+            ]
+
+        # Parse and validate due_date of every task, as for a single task
+        if isinstance(tasks_data, list):
+            for task_data in tasks_data:
+                if isinstance(task_data, dict) and task_data.get('due_date'):
+                    try:
+                        datetime.fromisoformat(task_data['due_date'].replace('Z', '+00:00'))
+                    except ValueError:
+                        return jsonify({"message": "Invalid due_date format"}), 400
+
+        # Get user_id from authenticated user (g.user['id'])
+        user_id = g.user['id']
+
+        # Call task_service.create_tasks_bulk with the list and user_id
+        created_tasks = task_service.create_tasks_bulk(tasks_data, user_id)
+
+        # Return created tasks, in request order, with 201 status code
+        return jsonify(created_tasks), 201
+
+    except ValidationError as e:
+        # Handle ValidationError and return 400 response
+        logger.warning(f"Validation error bulk creating tasks: {e}")
+        return jsonify({"message": str(e), "errors": e.errors}), 400
+    except Exception as e:
+        # Handle other exceptions and return appropriate error responses
+        logger.exception(f"Error bulk creating tasks: {e}")
+        return jsonify({"message": "Internal server error"}), 500
+
+
 @tasks_bp.route('/<string:task_id>', methods=['GET'])
 @token_required
 def get_task(task_id):
@@ -471,6 +516,46 @@ def add_subtask(task_id):
         return jsonify({"message": "Internal server error"}), 500
 
 
+@tasks_bp.route('/<string:task_id>/subtasks/bulk', methods=['POST'])
+@token_required
+def add_subtasks_bulk(task_id):
+    """Route handler for adding several subtasks to a task in one request"""
+    try:
+        # Extract the list of subtasks from request JSON
+        payload = request.get_json() or {}
+        subtasks_data = payload.get('subtasks')
+
+        # Get user_id from authenticated user (g.user['id'])
+        user_id = g.user['id']
+
+        # Call task_service.add_task_subtasks_bulk with task_id, the list and user_id
+        new_subtasks = task_service.add_task_subtasks_bulk(
+            task_id=task_id,
+            subtasks_data=subtasks_data,
+            user_id=user_id
+        )
+
+        # Return created subtasks, in request order, with 201 status code
+        return jsonify(new_subtasks), 201
+
+    except ValidationError as e:
+        # Handle ValidationError and return 400 response
+        logger.warning(f"Validation error bulk adding subtasks: {e}")
+        return jsonify({"message": str(e), "errors": e.errors}), 400
+    except NotFoundError as e:
+        # Handle NotFoundError and return 404 response
+        logger.warning(f"Task not found: {e}")
+        return jsonify({"message": str(e)}), 404
+    except AuthorizationError as e:
+        # Handle AuthorizationError and return 403 response
+        logger.warning(f"Authorization error bulk adding subtasks: {e}")
+        return jsonify({"message": str(e)}), 403
+    except Exception as e:
+        # Handle other exceptions and return appropriate error responses
+        logger.exception(f"Error bulk adding subtasks: {e}")
+        return jsonify({"message": "Internal server error"}), 500
+
+
 @tasks_bp.route('/<string:task_id>/subtasks/<string:subtask_id>', methods=['PUT'])
 @token_required
 def update_subtask(task_id, subtask_id):
@@ -19,7 +19,7 @@ from ...common.database.mongo.models import (
 from ...common.database.mongo.connection import get_db
 from ...common.utils.datetime import now, is_overdue, is_due_soon
 from ...common.utils.validators import (
-    validate_required, validate_string_length, validate_enum
+    validate_required, validate_string_length, validate_enum, validate_status_path
 )
 from ...common.events.event_bus import get_event_bus_instance, create_event
 from ...common.logging.logger import get_logger
@@ -301,6 +301,31 @@ class Task(Document):
         
         return self
     
+    def advance_status(self, target_status: str) -> 'Task':
+        """
+        Moves the task to a target status through the shortest chain of allowed transitions.
+        
+        Args:
+            target_status: The status to reach
+            
+        Returns:
+            Self with updated status
+            
+        Raises:
+            ValidationError: If the target status is invalid or cannot be reached
+        """
+        # Validate target status is a valid choice
+        if target_status not in TASK_STATUS_CHOICES:
+            raise ValidationError("Invalid status", {
+                "status": f"Status must be one of: {', '.join(TASK_STATUS_CHOICES)}"
+            })
+        
+        # Apply each step through set_status so activity and completedAt are recorded
+        for status in validate_status_path(self.get("status"), target_status, STATUS_TRANSITIONS):
+            self.set_status(status)
+        
+        return self
+    
     def assign_to(self, user_id: Union[str, bson.ObjectId]) -> 'Task':
         """
         Assigns the task to a user.
@@ -778,10 +803,26 @@ class Task(Document):
         # Use is_due_soon utility to check
         return is_due_soon(due_date, hours)
     
-    def calculate_completion_percentage(self) -> int:
+    def get_subtask_stats(self) -> Dict:
+        """
+        Counts the task's subtasks and how many of them are completed.
+        
+        Returns:
+            Dictionary with total and completed subtask counts
+        """
+        subtasks = self.get("subtasks", [])
+        return {
+            "total": len(subtasks),
+            "completed": sum(1 for st in subtasks if st.get("completed", False))
+        }
+    
+    def calculate_completion_percentage(self, subtask_stats: Dict = None) -> int:
         """
         Calculates the task completion percentage based on subtasks.
         
+        Args:
+            subtask_stats: Precomputed result of get_subtask_stats() (optional)
+        
         Returns:
             Percentage of completion (0-100)
         """
@@ -794,8 +835,9 @@ class Task(Document):
             return 0
         
         # If no subtasks, calculate based on status
-        subtasks = self.get("subtasks", [])
-        if not subtasks:
+        if subtask_stats is None:
+            subtask_stats = self.get_subtask_stats()
+        if not subtask_stats["total"]:
             # Not started tasks at 0%
             if self.get("status") in ["created", "assigned"]:
                 return 0
@@ -806,8 +848,8 @@ class Task(Document):
             return 0
         
         # Calculate percentage based on subtasks
-        total_subtasks = len(subtasks)
-        completed_subtasks = sum(1 for st in subtasks if st.get("completed", False))
+        total_subtasks = subtask_stats["total"]
+        completed_subtasks = subtask_stats["completed"]
         
         # Calculate percentage
         if total_subtasks > 0:
@@ -861,8 +903,10 @@ class Task(Document):
                 if field in task_dict["metadata"] and task_dict["metadata"][field]:
                     task_dict["metadata"][field] = task_dict["metadata"][field].isoformat()
         
-        # Add calculated fields
-        task_dict["completionPercentage"] = self.calculate_completion_percentage()
+        # Add calculated fields, counting subtasks once for both of them
+        subtask_stats = self.get_subtask_stats()
+        task_dict["subtaskStats"] = subtask_stats
+        task_dict["completionPercentage"] = self.calculate_completion_percentage(subtask_stats)
         task_dict["isOverdue"] = self.is_overdue()
         
         return task_dict
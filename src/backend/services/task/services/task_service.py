@@ -28,6 +28,12 @@ logger = get_logger(__name__)
 # Get event bus instance
 event_bus = get_event_bus_instance()
 
+# Upper bound on the number of tasks accepted by a single bulk create call
+MAX_BULK_TASKS = 100
+
+# Upper bound on the number of subtasks accepted by a single bulk add call
+MAX_BULK_SUBTASKS = 100
+
 
 class TaskService:
     """
@@ -56,6 +62,33 @@ class TaskService:
         """
         return create_task(task_data, user_id)
 
+    def create_tasks_bulk(self, tasks_data: List[Dict], user_id: str) -> List[Dict]:
+        """
+        Creates several tasks in a single call
+
+        Args:
+            tasks_data: List of task data
+            user_id: User ID
+
+        Returns:
+            Created tasks data, in request order
+        """
+        return create_tasks_bulk(tasks_data, user_id)
+
+    def add_task_subtasks_bulk(self, task_id: str, subtasks_data: List[Dict], user_id: str) -> List[Dict]:
+        """
+        Adds several subtasks to a task in a single call
+
+        Args:
+            task_id: Task ID
+            subtasks_data: List of subtask data (title, assignee_id)
+            user_id: User ID
+
+        Returns:
+            Created subtasks data, in request order
+        """
+        return add_task_subtasks_bulk(task_id, subtasks_data, user_id)
+
     def get_task(self, task_id: str, user_id: str) -> Dict:
         """
         Retrieves a task by ID
@@ -179,11 +212,13 @@ def create_task(task_data: Dict, user_id: str) -> Dict:
     # Set task created_by to user_id
     task_data["createdBy"] = user_id
 
+    # New tasks start in 'created' and are walked to the requested status, if any
+    initial_status = task_data.get("status") or "created"
+    task_data["status"] = "created"
+
     # Create Task instance using Task.from_dict
     task = Task.from_dict(task_data)
-
-    # Set initial status to 'created'
-    task.set_status("created")
+    task.advance_status(initial_status)
 
     # If assignee_id provided, assign task to user
     if "assigneeId" in task_data and task_data["assigneeId"]:
@@ -207,6 +242,26 @@ def create_task(task_data: Dict, user_id: str) -> Dict:
     return task.to_dict()
 
 
+def create_tasks_bulk(tasks_data: List[Dict], user_id: str) -> List[Dict]:
+    """
+    Creates several tasks at once, validating the whole batch before any task is saved
+    """
+    # Validate the batch itself
+    if not isinstance(tasks_data, list) or not tasks_data:
+        raise ValidationError("Invalid bulk request", {"tasks": "Must be a non-empty list"})
+    if len(tasks_data) > MAX_BULK_TASKS:
+        raise ValidationError("Invalid bulk request", {"tasks": f"At most {MAX_BULK_TASKS} tasks can be created at once"})
+
+    # Validate every entry up front so an invalid task does not leave a partial batch behind
+    for task_data in tasks_data:
+        validate_required(task_data, ["title"])
+        validate_enum(task_data.get("status"), TASK_STATUS_CHOICES, "status")
+        validate_enum(task_data.get("priority"), TASK_PRIORITY_CHOICES, "priority")
+
+    # Create tasks in request order
+    return [create_task(task_data, user_id) for task_data in tasks_data]
+
+
 def get_task(task_id: str, user_id: str) -> Dict:
     """
     Retrieves a task by ID with permission checking
@@ -445,6 +500,44 @@ def add_task_subtask(task_id: str, title: str, assignee_id: str, user_id: str) -
     return subtask
 
 
+def add_task_subtasks_bulk(task_id: str, subtasks_data: List[Dict], user_id: str) -> List[Dict]:
+    """
+    Adds several subtasks to a task, saving the task once for the whole batch
+    """
+    # Validate task_id is a valid ObjectId
+    validate_object_id(task_id, "task_id")
+
+    # Validate the batch itself
+    if not isinstance(subtasks_data, list) or not subtasks_data:
+        raise ValidationError("Invalid bulk request", {"subtasks": "Must be a non-empty list"})
+    if len(subtasks_data) > MAX_BULK_SUBTASKS:
+        raise ValidationError("Invalid bulk request", {"subtasks": f"At most {MAX_BULK_SUBTASKS} subtasks can be added at once"})
+
+    # Validate every entry up front so an invalid subtask does not leave a partial batch behind
+    for subtask_data in subtasks_data:
+        validate_required(subtask_data, ["title"])
+
+    # Get task using get_task_by_id function
+    task = get_task_by_id(task_id)
+
+    # If task not found, raise NotFoundError
+    if not task:
+        raise NotFoundError(message="Task not found", resource_type="Task", resource_id=task_id)
+
+    # Check if user has permission to update task
+    # Add subtasks in request order using task.add_subtask()
+    subtasks = [
+        task.add_subtask(title=subtask_data["title"], assignee_id=subtask_data.get("assignee_id"))
+        for subtask_data in subtasks_data
+    ]
+
+    # Save task changes to database once for the whole batch
+    task.save()
+
+    # Return subtasks data as a list of dictionaries
+    return subtasks
+
+
 def update_task_subtask(task_id: str, subtask_id: str, update_data: Dict, user_id: str) -> Dict:
     """
     Updates an existing subtask
@@ -0,0 +1,171 @@
+"""
+Unit and integration tests for the task API endpoints.
+Tests task creation, including bulk creation, and bulk subtask creation while verifying proper
+validation and error handling.
+"""
+# Third-party imports
+import pytest  # pytest-7.4.x
+
+# Internal imports
+from ..services.task_service import MAX_BULK_TASKS, MAX_BULK_SUBTASKS  # src/backend/services/task/services/task_service.py
+
+API_PREFIX = "/api/v1"
+
+
+def test_create_task_with_initial_status(authenticated_task_client):
+    """Tests task creation honors a requested initial status"""
+    # Request a status that needs created -> in_progress -> completed
+    task_data = {"title": "Completed Task", "status": "completed"}
+
+    # Make POST request to task creation endpoint
+    response = authenticated_task_client.post(f"{API_PREFIX}/tasks", json=task_data)
+
+    # Verify the task was created directly in the requested status
+    assert response.status_code == 201
+    response_data = response.get_json()
+    assert response_data["status"] == "completed"
+    assert response_data["metadata"]["completedAt"] is not None
+
+
+def test_create_task_invalid_initial_status(authenticated_task_client):
+    """Tests task creation fails for an unknown initial status"""
+    # Make POST request to task creation endpoint with an unknown status
+    response = authenticated_task_client.post(
+        f"{API_PREFIX}/tasks", json={"title": "Task", "status": "unknown"}
+    )
+
+    # Verify 400 status code in response
+    assert response.status_code == 400
+
+
+def test_create_tasks_bulk_success(authenticated_task_client):
+    """Tests bulk task creation returns the created tasks in request order"""
+    # Create several valid tasks with different priorities
+    priorities = ["low", "medium", "high"]
+    tasks = [
+        {"title": f"Bulk Task {index}", "priority": priority}
+        for index, priority in enumerate(priorities)
+    ]
+
+    # Make POST request to bulk task creation endpoint
+    response = authenticated_task_client.post(f"{API_PREFIX}/tasks/bulk", json={"tasks": tasks})
+
+    # Verify 201 status code in response
+    assert response.status_code == 201
+
+    # Verify order and priorities are preserved
+    response_data = response.get_json()
+    assert [task["title"] for task in response_data] == [task["title"] for task in tasks]
+    assert [task["priority"] for task in response_data] == priorities
+
+
+@pytest.mark.parametrize('tasks', [[], None, [{"title": "Task"}] * (MAX_BULK_TASKS + 1)])
+def test_create_tasks_bulk_invalid_batch(authenticated_task_client, tasks):
+    """Tests bulk task creation fails for an empty, missing or oversized task list"""
+    # Make POST request to bulk task creation endpoint
+    response = authenticated_task_client.post(f"{API_PREFIX}/tasks/bulk", json={"tasks": tasks})
+
+    # Verify 400 status code in response
+    assert response.status_code == 400
+
+    # Verify the error points at the task list
+    assert "tasks" in response.get_json()["errors"]
+
+
+@pytest.mark.parametrize('invalid_task, error_field', [
+    ({"description": "Task without title"}, "title"),
+    ({"title": "Task", "status": "unknown"}, "status"),
+    ({"title": "Task", "priority": "unknown"}, "priority"),
+])
+def test_create_tasks_bulk_invalid_entry(authenticated_task_client, invalid_task, error_field):
+    """Tests bulk task creation rejects the whole batch if any entry is invalid"""
+    # Second task in the batch is invalid
+    tasks = [{"title": "Valid Task"}, invalid_task]
+
+    # Make POST request to bulk task creation endpoint
+    response = authenticated_task_client.post(f"{API_PREFIX}/tasks/bulk", json={"tasks": tasks})
+
+    # Verify 400 status code in response
+    assert response.status_code == 400
+
+    # Verify the error names the invalid field
+    assert error_field in response.get_json()["errors"]
+
+
+def test_create_tasks_bulk_invalid_due_date(authenticated_task_client):
+    """Tests bulk task creation rejects an entry with a malformed due_date"""
+    # Second task has a due_date that is not ISO-8601
+    tasks = [{"title": "Valid Task"}, {"title": "Bad Date Task", "due_date": "next tuesday"}]
+
+    # Make POST request to bulk task creation endpoint
+    response = authenticated_task_client.post(f"{API_PREFIX}/tasks/bulk", json={"tasks": tasks})
+
+    # Verify 400 status code and the same message as single task creation
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "Invalid due_date format"
+
+
+def test_add_subtasks_bulk_success(authenticated_task_client, test_task):
+    """Tests bulk subtask creation adds every subtask to the task in request order"""
+    # Extract task ID from test_task fixture
+    task_id = test_task["_id"]
+
+    # Create several valid subtasks
+    subtasks = [{"title": f"Subtask {index}"} for index in range(3)]
+
+    # Make POST request to bulk subtask creation endpoint
+    response = authenticated_task_client.post(
+        f"{API_PREFIX}/tasks/{task_id}/subtasks/bulk", json={"subtasks": subtasks}
+    )
+
+    # Verify 201 status code in response
+    assert response.status_code == 201
+
+    # Verify the created subtasks keep request order and start incomplete
+    response_data = response.get_json()
+    assert [subtask["title"] for subtask in response_data] == [subtask["title"] for subtask in subtasks]
+    assert not any(subtask["completed"] for subtask in response_data)
+
+    # Verify the subtasks were saved on the task
+    response = authenticated_task_client.get(f"{API_PREFIX}/tasks/{task_id}")
+    assert response.get_json()["subtaskStats"] == {"total": 3, "completed": 0}
+
+
+@pytest.mark.parametrize('subtasks', [[], None, [{"title": "Subtask"}] * (MAX_BULK_SUBTASKS + 1)])
+def test_add_subtasks_bulk_invalid_batch(authenticated_task_client, test_task, subtasks):
+    """Tests bulk subtask creation fails for an empty, missing or oversized subtask list"""
+    # Extract task ID from test_task fixture
+    task_id = test_task["_id"]
+
+    # Make POST request to bulk subtask creation endpoint
+    response = authenticated_task_client.post(
+        f"{API_PREFIX}/tasks/{task_id}/subtasks/bulk", json={"subtasks": subtasks}
+    )
+
+    # Verify 400 status code in response
+    assert response.status_code == 400
+
+    # Verify the error points at the subtask list
+    assert "subtasks" in response.get_json()["errors"]
+
+
+def test_add_subtasks_bulk_invalid_entry(authenticated_task_client, test_task):
+    """Tests bulk subtask creation adds nothing if any entry is invalid"""
+    # Extract task ID from test_task fixture
+    task_id = test_task["_id"]
+
+    # Second subtask is missing its title
+    subtasks = [{"title": "Valid Subtask"}, {"assignee_id": None}]
+
+    # Make POST request to bulk subtask creation endpoint
+    response = authenticated_task_client.post(
+        f"{API_PREFIX}/tasks/{task_id}/subtasks/bulk", json={"subtasks": subtasks}
+    )
+
+    # Verify 400 status code in response
+    assert response.status_code == 400
+    assert "title" in response.get_json()["errors"]
+
+    # Verify the valid subtask was not saved either
+    response = authenticated_task_client.get(f"{API_PREFIX}/tasks/{task_id}")
+    assert response.get_json()["subtaskStats"]["total"] == 0
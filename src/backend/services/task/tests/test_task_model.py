@@ -0,0 +1,96 @@
+"""
+Unit tests for the Task model.
+Tests status workflow transitions and subtask statistics without going through the API.
+"""
+# Third-party imports
+import pytest  # pytest-7.4.x
+
+# Internal imports
+from ..models.task import Task  # src/backend/services/task/models/task.py
+from ....common.exceptions.api_exceptions import ValidationError  # src/backend/common/exceptions/api_exceptions.py
+
+
+def test_advance_status_walks_allowed_transitions():
+    """Tests advance_status reaches a later status through the allowed chain"""
+    # New tasks start in 'created'
+    task = Task.from_dict({"title": "Task"})
+
+    # Advance to a status that needs created -> in_progress -> completed
+    task.advance_status("completed")
+
+    # Verify the target status was reached and completion was recorded
+    assert task.get("status") == "completed"
+    assert task.get("metadata")["completedAt"] is not None
+
+
+def test_advance_status_to_current_status():
+    """Tests advance_status leaves a task already in the target status unchanged"""
+    task = Task.from_dict({"title": "Task"})
+
+    task.advance_status("created")
+
+    assert task.get("status") == "created"
+
+
+def test_advance_status_invalid_status():
+    """Tests advance_status rejects an unknown status"""
+    task = Task.from_dict({"title": "Task"})
+
+    with pytest.raises(ValidationError):
+        task.advance_status("unknown")
+
+
+def test_advance_status_unreachable_status():
+    """Tests advance_status rejects a status that cannot be reached from the current one"""
+    # Completed is a terminal state
+    task = Task.from_dict({"title": "Task", "status": "completed"})
+
+    with pytest.raises(ValidationError):
+        task.advance_status("in_progress")
+
+    # Verify the status was left unchanged
+    assert task.get("status") == "completed"
+
+
+@pytest.mark.parametrize('completed_flags, expected_stats', [
+    ([], {"total": 0, "completed": 0}),
+    ([True, True], {"total": 2, "completed": 2}),
+    ([True, False, False], {"total": 3, "completed": 1}),
+])
+def test_get_subtask_stats(completed_flags, expected_stats):
+    """Tests get_subtask_stats counts all and completed subtasks"""
+    # Build a task with subtasks in the given completion states
+    subtasks = [
+        {"id": f"subtask{index}", "title": f"Subtask {index}", "completed": completed}
+        for index, completed in enumerate(completed_flags)
+    ]
+    task = Task.from_dict({"title": "Task", "status": "in_progress", "subtasks": subtasks})
+
+    # Verify the counts, both directly and in the serialized task
+    assert task.get_subtask_stats() == expected_stats
+    assert task.to_dict()["subtaskStats"] == expected_stats
+
+
+@pytest.mark.parametrize('subtask_stats, expected_percentage', [
+    ({"total": 0, "completed": 0}, 50),
+    ({"total": 2, "completed": 2}, 100),
+    ({"total": 3, "completed": 1}, 33),
+])
+def test_calculate_completion_percentage_with_stats(subtask_stats, expected_percentage):
+    """Tests calculate_completion_percentage uses precomputed subtask stats when given"""
+    # The task has no subtasks of its own, so only the given stats can produce the result
+    task = Task.from_dict({"title": "Task", "status": "in_progress"})
+
+    assert task.calculate_completion_percentage(subtask_stats=subtask_stats) == expected_percentage
+
+
+def test_calculate_completion_percentage_without_stats():
+    """Tests calculate_completion_percentage counts the task's subtasks when no stats are given"""
+    subtasks = [
+        {"id": "subtask1", "title": "Subtask 1", "completed": True},
+        {"id": "subtask2", "title": "Subtask 2", "completed": False},
+    ]
+    task = Task.from_dict({"title": "Task", "status": "in_progress", "subtasks": subtasks})
+
+    assert task.calculate_completion_percentage() == 50
+    assert task.to_dict()["completionPercentage"] == 50
@@ -11,10 +11,13 @@ import uuid
 import json
 
 # Third-party imports
+import bson
+import orjson
 import pytest
 import mongomock
 import fakeredis
 import requests
+from filelock import FileLock
 
 # Internal imports
 from ..common.testing.fixtures import app_factory
@@ -31,8 +34,39 @@ TEST_USER_PASSWORD = "SecurePassword123!"
 TEST_ADMIN_EMAIL = "admin@example.com"
 TEST_ADMIN_PASSWORD = "AdminSecurePass123!"
 
+# Identifier generated once per test run, used to keep test data unique across runs and workers
+RUN_ID = uuid.uuid4().hex[:12]
 
-@pytest.fixture
+# pytest-xdist worker id ("gw0", "gw1", ...), empty when tests are not distributed
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+
+# Number of pytest-xdist workers, 0 when tests are not distributed
+XDIST_WORKER_COUNT = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "0"))
+
+
+def worker_scoped(value):
+    """
+    Makes a fixture identifier unique to the current pytest-xdist worker.
+    
+    Workers sharing a real database would otherwise upsert the same users, projects
+    and tasks and see each other's data. Email addresses get the worker id as a
+    plus-address tag so they stay valid addresses.
+    
+    Args:
+        value (str): Identifier or email address
+        
+    Returns:
+        str: The value unchanged outside xdist, otherwise tagged with the worker id
+    """
+    if not XDIST_WORKER:
+        return value
+    if "@" in value:
+        local_part, domain = value.split("@", 1)
+        return f"{local_part}+{XDIST_WORKER}@{domain}"
+    return f"{value}_{XDIST_WORKER}"
+
+
+@pytest.fixture(scope="session")
 def base_url():
     """
     Provides the base URL for API requests in tests.
@@ -44,10 +78,44 @@ def base_url():
 
 
 @pytest.fixture(scope="session")
-def mongo_db():
+def last_worker_done(tmp_path_factory):
+    """
+    Provides a check telling a session fixture's teardown whether it is the last
+    pytest-xdist worker to finish with a shared resource.
+    
+    Workers share the real database and Redis instance, so these must only be
+    cleaned up once every worker is done with them. Each call records the calling
+    worker in a counter file under a file lock and returns True for the worker
+    completing the count. A resource some worker never set up is left in place
+    rather than cleaned up while others may still use it.
+    
+    Args:
+        tmp_path_factory (TempPathFactory): pytest temp path factory
+        
+    Returns:
+        callable: Function taking a resource name, returning True when cleanup should run
+    """
+    def _check(name):
+        if not XDIST_WORKER:
+            return True
+        
+        counter_file = tmp_path_factory.getbasetemp().parent / f"{name}.finished"
+        with FileLock(f"{counter_file}.lock"):
+            finished = int(counter_file.read_text()) + 1 if counter_file.is_file() else 1
+            counter_file.write_text(str(finished))
+        return finished == XDIST_WORKER_COUNT
+    
+    return _check
+
+
+@pytest.fixture(scope="session")
+def mongo_db(last_worker_done):
     """
     Creates a mock or real MongoDB connection for tests based on configuration.
     
+    Args:
+        last_worker_done (callable): Check for the last xdist worker to finish
+        
     Returns:
         mongomock.MongoClient: MongoDB client for testing
     """
@@ -59,9 +127,11 @@ def mongo_db():
         client = get_db()
         # Initialize required collections and indexes
         yield client
-        # After tests, clean up by dropping test databases if using real MongoDB
-        test_db_name = os.environ.get('TEST_MONGO_DB_NAME', 'task_management_test')
-        client.drop_database(test_db_name)
+        # After tests, clean up by dropping test databases if using real MongoDB,
+        # once every xdist worker is done with them
+        if last_worker_done("mongo_db"):
+            test_db_name = os.environ.get('TEST_MONGO_DB_NAME', 'task_management_test')
+            client.drop_database(test_db_name)
     else:
         # Otherwise, create a mongomock client
         client = mock_mongo_client()
@@ -69,10 +139,13 @@ def mongo_db():
 
 
 @pytest.fixture(scope="session")
-def redis_cache():
+def redis_cache(last_worker_done):
     """
     Creates a mock or real Redis connection for tests based on configuration.
     
+    Args:
+        last_worker_done (callable): Check for the last xdist worker to finish
+        
     Returns:
         fakeredis.FakeStrictRedis: Redis client for testing
     """
@@ -83,14 +156,49 @@ def redis_cache():
         # If using real Redis, create a connection to a test database
         client = get_redis()
         yield client
-        # After tests, flush the Redis database if using real Redis
-        client.flushall()
+        # After tests, flush the Redis database if using real Redis,
+        # once every xdist worker is done with it
+        if last_worker_done("redis_cache"):
+            client.flushall()
     else:
         # Otherwise, create a fakeredis instance
         client = mock_redis_client()
         yield client
 
 
+@pytest.fixture(scope="session")
+def worker_shared_data(tmp_path_factory, worker_id):
+    """
+    Provides a helper that produces session data once across all pytest-xdist workers.
+    
+    The first worker to ask for a given name computes the data and writes it to a JSON
+    file in the shared temp directory; the other workers read it back under a file lock.
+    Sharing only happens against a real database, since mongomock state is per worker.
+    
+    Args:
+        tmp_path_factory (TempPathFactory): pytest temp path factory
+        worker_id (str): pytest-xdist worker id ("master" when not distributed)
+        
+    Returns:
+        callable: Function taking a cache name and a producer callable
+    """
+    use_real_db = os.environ.get('TESTING_USE_REAL_DB', 'false').lower() == 'true'
+    
+    def _get(name, produce):
+        if worker_id == "master" or not use_real_db:
+            return produce()
+        
+        cache_file = tmp_path_factory.getbasetemp().parent / f"{name}.json"
+        with FileLock(f"{cache_file}.lock"):
+            if cache_file.is_file():
+                return json.loads(cache_file.read_text())
+            data = produce()
+            cache_file.write_text(json.dumps(data))
+            return data
+    
+    return _get
+
+
 @pytest.fixture
 def event_bus():
     """
@@ -103,10 +211,10 @@ def event_bus():
     return mock_event_bus()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_app():
     """
-    Creates a Flask application instance for testing.
+    Creates a Flask application instance for testing, shared across the test session.
     
     Returns:
         Flask: Flask application configured for testing
@@ -133,7 +241,7 @@ def test_client(test_app):
     return test_app.test_client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standard_roles(mongo_db):
     """
     Creates standard user roles for testing.
@@ -171,7 +279,7 @@ def standard_roles(mongo_db):
     return roles
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user(mongo_db, standard_roles):
     """
     Creates a standard test user for testing.
@@ -185,8 +293,8 @@ def test_user(mongo_db, standard_roles):
     """
     # Create a user document with test email and password
     user = {
-        "_id": "test_user_id",
-        "email": TEST_USER_EMAIL,
+        "_id": worker_scoped("test_user_id"),
+        "email": worker_scoped(TEST_USER_EMAIL),
         "password": "$2b$12$1234567890123456789012uXJVK2Ew5V0mZrSEYvwzPrJsGmXyMDu",  # Hashed password
         "firstName": "Test",
         "lastName": "User",
@@ -209,7 +317,7 @@ def test_user(mongo_db, standard_roles):
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_admin(mongo_db, standard_roles):
     """
     Creates an admin user for testing administrative functions.
@@ -223,8 +331,8 @@ def test_admin(mongo_db, standard_roles):
     """
     # Create a user document with admin email and password
     admin = {
-        "_id": "test_admin_id",
-        "email": TEST_ADMIN_EMAIL,
+        "_id": worker_scoped("test_admin_id"),
+        "email": worker_scoped(TEST_ADMIN_EMAIL),
         "password": "$2b$12$0987654321098765432109ugwfgwigfwigfwuegfuewgfgewgweweg",  # Hashed password
         "firstName": "Admin",
         "lastName": "User",
@@ -247,11 +355,15 @@ def test_admin(mongo_db, standard_roles):
     return admin
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def authenticated_user_headers(test_user):
     """
     Creates authentication headers for a standard user.
     
+    Access tokens expire after ACCESS_TOKEN_EXPIRE_MINUTES (15 by default), so tokens
+    are minted per module rather than per session, where a long run (coverage, a real
+    database) would start failing with 401 partway through.
+    
     Args:
         test_user (dict): Test user document
         
@@ -272,10 +384,11 @@ def authenticated_user_headers(test_user):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def authenticated_admin_headers(test_admin):
     """
-    Creates authentication headers for an admin user.
+    Creates authentication headers for an admin user, minted per module like
+    authenticated_user_headers.
     
     Args:
         test_admin (dict): Admin user document
@@ -297,42 +410,116 @@ def authenticated_admin_headers(test_admin):
     }
 
 
-@pytest.fixture
-def authenticated_client(test_client, authenticated_user_headers):
+@pytest.fixture(scope="module")
+def authenticated_client(test_app, authenticated_user_headers):
     """
     Creates an authenticated test client with standard user permissions.
     
+    The client is a thin wrapper over the session-scoped application that injects the
+    Authorization header into every request, leaving the plain test_client untouched.
+    It is built once per module, with that module's token; the user and role documents
+    behind it are session-scoped idempotent upserts that no test modifies.
+    
     Args:
-        test_client (FlaskClient): Flask test client
+        test_app (Flask): Flask application
         authenticated_user_headers (dict): Headers with auth token
         
     Returns:
         FlaskClient: Authenticated test client for API requests
     """
-    # Create a test client using the test_client fixture
-    test_client.environ_base = {
+    client = test_app.test_client()
+    client.environ_base = {
         'HTTP_AUTHORIZATION': authenticated_user_headers["Authorization"]
     }
-    return test_client
+    return client
 
 
-@pytest.fixture
-def authenticated_admin_client(test_client, authenticated_admin_headers):
+@pytest.fixture(scope="module")
+def authenticated_admin_client(test_app, authenticated_admin_headers):
     """
     Creates an authenticated test client with admin permissions.
     
     Args:
-        test_client (FlaskClient): Flask test client
+        test_app (Flask): Flask application
         authenticated_admin_headers (dict): Headers with admin auth token
         
     Returns:
         FlaskClient: Authenticated admin test client for API requests
     """
-    # Create a test client using the test_client fixture
-    test_client.environ_base = {
+    client = test_app.test_client()
+    client.environ_base = {
         'HTTP_AUTHORIZATION': authenticated_admin_headers["Authorization"]
     }
-    return test_client
+    return client
+
+
+@pytest.fixture(scope="session")
+def another_user(worker_shared_data, last_worker_done, mongo_db):
+    """
+    Creates a second standard user once per test session, for ownership,
+    membership and assignment tests.
+    
+    The user is inserted directly, skipping the password hashing done by the
+    register endpoint; another_user_client signs its tokens. Under pytest-xdist
+    the user is created by a single worker and shared with the others through
+    worker_shared_data.
+    
+    Args:
+        worker_shared_data (callable): Helper sharing session data across xdist workers
+        last_worker_done (callable): Check for the last xdist worker to finish
+        mongo_db (mongomock.MongoClient): MongoDB client
+        
+    Yields:
+        dict: User details
+    """
+    def _create():
+        user = create_test_user(
+            mongo_db,
+            email=f"another_user_{RUN_ID}@example.com",
+            password=TEST_USER_PASSWORD,
+            first_name="Another",
+            last_name="User"
+        )
+        
+        return {
+            "_id": user["_id"],
+            "email": user["email"],
+            "firstName": user["firstName"],
+            "lastName": user["lastName"]
+        }
+    
+    user = worker_shared_data("another_user", _create)
+    yield user
+    
+    # Remove the user once every xdist worker sharing it is done
+    if last_worker_done("another_user"):
+        mongo_db.users.delete_one({"_id": user["_id"]})
+
+
+@pytest.fixture(scope="module")
+def another_user_client(test_app, another_user):
+    """
+    Creates a test client authenticated as another_user, with a token minted per
+    module like authenticated_user_headers.
+    
+    Args:
+        test_app (Flask): Flask application
+        another_user (dict): Second test user
+        
+    Returns:
+        FlaskClient: Test client sending another_user's token with every request
+    """
+    token = generate_access_token({
+        "user_id": another_user["_id"],
+        "email": another_user["email"],
+        "role": "user"
+    })
+    
+    client = test_app.test_client()
+    client.environ_base = {
+        'HTTP_AUTHORIZATION': f"Bearer {token}"
+    }
+    return client
 
 
 @pytest.fixture
@@ -349,7 +536,7 @@ def test_project(mongo_db, test_user):
     """
     # Create a project document with test name and description
     project = {
-        "_id": "test_project_id",
+        "_id": worker_scoped("test_project_id"),
         "name": "Test Project",
         "description": "This is a test project for testing purposes",
         "status": "active",
@@ -401,7 +588,7 @@ def test_task(mongo_db, test_user, test_project):
     due_date = datetime.datetime.utcnow() + datetime.timedelta(days=7)
     
     task = {
-        "_id": "test_task_id",
+        "_id": worker_scoped("test_task_id"),
         "title": "Test Task",
         "description": "This is a test task for testing purposes",
         "status": "in_progress",
@@ -500,8 +687,9 @@ def create_test_project(mongo_db, name, description, owner, members=None, status
     Returns:
         dict: Created project document
     """
-    # Create project document with provided parameters
-    project_id = str(uuid.uuid4())
+    # Create project document with provided parameters, using an ObjectId string
+    # since tasks reference projects by ObjectId
+    project_id = str(bson.ObjectId())
     
     # Format members list with appropriate role information
     if members is None:
@@ -556,8 +744,9 @@ def create_test_user(mongo_db, email, password, roles=None, first_name="Test", l
     Returns:
         dict: Created user document
     """
-    # Create user document with provided parameters
-    user_id = str(uuid.uuid4())
+    # Create user document with provided parameters, using an ObjectId string
+    # since the services validate user ids as ObjectIds
+    user_id = str(bson.ObjectId())
     
     # Hash the provided password (simplified for testing)
     password_hash = f"$2b$12${uuid.uuid4().hex[:22]}"
@@ -591,6 +780,44 @@ def create_test_user(mongo_db, email, password, roles=None, first_name="Test", l
     return user
 
 
+def create_api_factory(base_url, resource, defaults, on_create=None):
+    """
+    Utility function to build a factory creating resources through the API.
+    
+    Resources requested with cached=True are created once per factory and reused
+    by every read-only test asking for the same data.
+    
+    Args:
+        base_url (str): Base API URL
+        resource (str): Collection path below the base URL, e.g. "tasks"
+        defaults (dict): Request body fields used unless overridden
+        on_create (callable): Optional callback receiving the client and each created resource
+        
+    Returns:
+        callable: Factory taking an authenticated client and field overrides
+    """
+    cache = {}
+    
+    def _make(client, cached=False, **overrides):
+        data = {**defaults, **overrides}
+        
+        key = tuple(sorted(data.items()))
+        if cached and key in cache:
+            return cache[key]
+        
+        response = client.post(f"{base_url}/{resource}", json=data)
+        assert response.status_code == 201, f"Failed to create test {resource}: {response.data!r}"
+        
+        created = orjson.loads(response.data)
+        if on_create is not None:
+            on_create(client, created)
+        if cached:
+            cache[key] = created
+        return created
+    
+    return _make
+
+
 @pytest.fixture
 def test_notification(mongo_db, test_user):
     """
@@ -605,16 +832,16 @@ def test_notification(mongo_db, test_user):
     """
     # Create a notification document for test_user
     notification = {
-        "_id": "test_notification_id",
+        "_id": worker_scoped("test_notification_id"),
         "userId": test_user["_id"],
         "type": "task_assigned",
         "title": "Task Assigned",
         "content": "You have been assigned a new task: Test Task",
         "read": False,
-        "actionUrl": "/tasks/test_task_id",
+        "actionUrl": f"/tasks/{worker_scoped('test_task_id')}",
         "createdAt": datetime.datetime.utcnow(),
         "metadata": {
-            "taskId": "test_task_id"
+            "taskId": worker_scoped("test_task_id")
         }
     }
     
@@ -638,11 +865,11 @@ def test_file(mongo_db, test_user):
     """
     # Create a file document with test filename and content type
     file = {
-        "_id": "test_file_id",
+        "_id": worker_scoped("test_file_id"),
         "name": "test_document.pdf",
         "size": 12345,
         "type": "application/pdf",
-        "storageKey": "uploads/test_user_id/test_document.pdf",
+        "storageKey": f"uploads/{test_user['_id']}/test_document.pdf",
         "uploadedBy": test_user["_id"],
         "uploadedAt": datetime.datetime.utcnow(),
         "metadata": {
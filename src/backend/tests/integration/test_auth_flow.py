@@ -5,7 +5,7 @@ including registration, login, token refresh, and logout.
 
 import pytest
 import requests
-import json
+import orjson
 import time
 import re
 import os
@@ -118,7 +118,7 @@ def authenticated_user(base_url, test_client, verified_user):
     )
     
     # Get response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Return user data enriched with access and refresh tokens
     user_data = verified_user.copy()
@@ -162,8 +162,14 @@ def mock_email_service():
                 if token_match:
                     self.reset_tokens[to] = token_match.group(1)
         
-        def get_verification_token(self, email):
-            return self.verification_tokens.get(email)
+        def get_verification_token(self, email, _retries=5):
+            # Poll briefly in case the verification email is delivered asynchronously
+            for _ in range(_retries):
+                token = self.verification_tokens.get(email)
+                if token:
+                    return token
+                time.sleep(0.01)
+            return None
         
         def get_reset_token(self, email):
             return self.reset_tokens.get(email)
@@ -229,7 +235,7 @@ def test_user_registration_success(base_url, test_client):
     assert response.status_code == 201
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify response contains user data and token
     assert "id" in response_data
@@ -270,7 +276,7 @@ def test_user_registration_duplicate_email(base_url, test_client, registered_use
     assert response.status_code == 400
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify error message indicates duplicate email
     assert "errors" in response_data
@@ -297,7 +303,7 @@ def test_user_registration_invalid_data(base_url, test_client):
     
     # Verify 400 status code and appropriate error message
     assert response.status_code == 400
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert "errors" in response_data
     assert "email" in response_data["errors"]
     
@@ -316,7 +322,7 @@ def test_user_registration_invalid_data(base_url, test_client):
     
     # Verify 400 status code and password requirements error
     assert response.status_code == 400
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert "errors" in response_data
     assert "password" in response_data["errors"]
     
@@ -333,7 +339,7 @@ def test_user_registration_invalid_data(base_url, test_client):
     
     # Verify 400 status code and missing field errors
     assert response.status_code == 400
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert "errors" in response_data
     assert "password" in response_data["errors"]
 
@@ -364,7 +370,7 @@ def test_email_verification_flow(base_url, test_client, unverified_user, mock_em
         json=login_data
     )
     
-    login_data = json.loads(login_response.data)
+    login_data = orjson.loads(login_response.data)
     access_token = login_data.get("access_token")
     
     # Send GET request to get user profile
@@ -373,7 +379,7 @@ def test_email_verification_flow(base_url, test_client, unverified_user, mock_em
         headers={"Authorization": f"Bearer {access_token}"}
     )
     
-    profile_data = json.loads(profile_response.data)
+    profile_data = orjson.loads(profile_response.data)
     
     # Verify user email is now marked as verified
     assert "emailVerified" in profile_data
@@ -399,7 +405,7 @@ def test_login_success(base_url, test_client, verified_user):
     assert response.status_code == 200
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify response contains access token and refresh token
     assert "access_token" in response_data
@@ -429,7 +435,7 @@ def test_login_invalid_credentials(base_url, test_client, verified_user):
     assert response.status_code == 401
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify error message indicates invalid credentials
     assert "invalid credentials" in response_data.get("message", "").lower()
@@ -449,7 +455,7 @@ def test_login_invalid_credentials(base_url, test_client, verified_user):
     assert response.status_code == 401
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify error message indicates invalid credentials
     assert "invalid credentials" in response_data.get("message", "").lower()
@@ -471,7 +477,7 @@ def test_login_unverified_user(base_url, test_client, unverified_user):
     )
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify response indicates email verification required
     assert any([
@@ -556,7 +562,7 @@ def test_token_refresh(base_url, test_client, authenticated_user):
     assert response.status_code == 200
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify response contains new access token
     assert "access_token" in response_data
@@ -591,7 +597,7 @@ def test_token_refresh_invalid_token(base_url, test_client):
     assert response.status_code == 401
     
     # Parse response data
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     
     # Verify error message indicates invalid token
     assert "invalid" in response_data.get("message", "").lower()
@@ -669,7 +675,7 @@ def test_mfa_flow(base_url, test_client, verified_user, mock_mfa_service):
         json=login_data
     )
     
-    login_data = json.loads(login_response.data)
+    login_data = orjson.loads(login_response.data)
     access_token = login_data["access_token"]
     
     # Setup MFA for the user
@@ -703,7 +709,7 @@ def test_mfa_flow(base_url, test_client, verified_user, mock_mfa_service):
         json=login_data
     )
     
-    login_result = json.loads(login_response.data)
+    login_result = orjson.loads(login_response.data)
     
     # Verify response indicates MFA verification required
     assert "mfa_required" in login_result
@@ -722,7 +728,7 @@ def test_mfa_flow(base_url, test_client, verified_user, mock_mfa_service):
     
     assert mfa_completion_response.status_code == 200
     
-    mfa_result = json.loads(mfa_completion_response.data)
+    mfa_result = orjson.loads(mfa_completion_response.data)
     
     # Verify can access protected endpoints with the token
     assert "access_token" in mfa_result
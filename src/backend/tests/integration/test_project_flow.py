@@ -7,107 +7,128 @@ API endpoints function correctly with proper authorization and maintain data int
 across operations.
 """
 
-import json
-import time
+import orjson
+import os
+import uuid
 import pytest
 import requests
 
+from ..conftest import RUN_ID, create_api_factory
 
-@pytest.fixture
-def test_project(base_url, authenticated_client, test_user):
+
+@pytest.fixture(scope="module")
+def created_projects(base_url):
     """
-    Creates a test project for the authenticated user.
+    Tracks the projects created by this module and deletes them with bulk
+    requests after its last test, so repeated runs against a persistent
+    database do not keep growing the project listings.
+    
+    Every project tracked here belongs to the test user. Set CLEAN_FIXTURES=0
+    to keep the projects around when debugging.
     
     Args:
         base_url: Base API URL
-        authenticated_client: HTTP client with authentication
-        test_user: Test user fixture
         
     Returns:
-        dict: Dictionary containing project details
+        callable: Function registering a created project with the client that created it
     """
-    # Generate project data
-    project_data = {
-        "name": "Test Project",
-        "description": "A project created for integration testing",
-        "category": "testing"
-    }
+    project_ids = []
+    owner = {}
     
-    # Create project
-    response = authenticated_client.post(
-        f"{base_url}/projects",
-        json=project_data
-    )
+    def _track(client, project_id):
+        project_ids.append(project_id)
+        owner["client"] = client
     
-    assert response.status_code == 201, f"Failed to create test project: {response.text}"
+    yield _track
     
-    return response.json()
+    if os.environ.get("CLEAN_FIXTURES", "1") != "1":
+        return
+    
+    # The bulk endpoint accepts at most 100 projects per request
+    for start in range(0, len(project_ids), 100):
+        response = owner["client"].post(
+            f"{base_url}/projects/bulk-delete",
+            json={"ids": project_ids[start:start + 100]}
+        )
+        assert response.status_code == 200, f"Failed to clean up test projects: {response.data!r}"
 
 
-@pytest.fixture
-def another_user(base_url, test_client):
+@pytest.fixture(scope="module")
+def project_factory(base_url, created_projects):
     """
-    Creates another test user.
+    Creates projects on demand for the tests in this module.
+    
+    Projects requested with cached=True are created once and reused by every
+    read-only test asking for the same data. Created projects are cleaned up
+    through created_projects.
     
     Args:
         base_url: Base API URL
-        test_client: HTTP client without authentication
+        created_projects: Module-scoped tracker of created projects
         
     Returns:
-        dict: Dictionary containing user details and authentication tokens
-    """
-    # Generate unique user data
-    user_data = {
-        "email": f"another_user_{int(time.time())}@example.com",
-        "password": "SecurePassword123!",
-        "firstName": "Another",
-        "lastName": "User"
-    }
-    
-    # Register user
-    response = test_client.post(
-        f"{base_url}/auth/register",
-        json=user_data
+        callable: Factory taking an authenticated client and project field overrides
+    """
+    return create_api_factory(
+        base_url,
+        "projects",
+        {
+            "name": "Test Project",
+            "description": "A project created for integration testing",
+            "category": "testing"
+        },
+        on_create=lambda client, project: created_projects(client, project["id"])
     )
+
+
+@pytest.fixture
+def test_project(project_factory, authenticated_client, test_user):
+    """
+    Creates a fresh test project for the authenticated user.
     
-    assert response.status_code == 201, f"Failed to create another user: {response.text}"
-    
-    # Login to get tokens
-    login_response = test_client.post(
-        f"{base_url}/auth/login",
-        json={
-            "email": user_data["email"],
-            "password": user_data["password"]
-        }
-    )
+    Use this for tests that mutate the project.
     
-    assert login_response.status_code == 200, f"Failed to login as another user: {login_response.text}"
-    
-    # Return user data with tokens
-    tokens = login_response.json()
-    return {
-        "id": tokens.get("user_id"),
-        "email": user_data["email"],
-        "firstName": user_data["firstName"],
-        "lastName": user_data["lastName"],
-        "access_token": tokens.get("access_token"),
-        "refresh_token": tokens.get("refresh_token")
-    }
+    Args:
+        project_factory: Module-scoped project factory
+        authenticated_client: HTTP client with authentication
+        test_user: Test user fixture
+        
+    Returns:
+        dict: Dictionary containing project details
+    """
+    return project_factory(authenticated_client)
 
 
 @pytest.fixture
-def other_user_project(base_url, test_client, another_user):
+def shared_project(project_factory, authenticated_client, test_user):
     """
-    Creates a project owned by a different user.
+    Returns a test project shared by the read-only tests of this module.
     
     Args:
-        base_url: Base API URL
-        test_client: HTTP client without authentication
-        another_user: Another test user fixture
+        project_factory: Module-scoped project factory
+        authenticated_client: HTTP client with authentication
+        test_user: Test user fixture
         
     Returns:
         dict: Dictionary containing project details
     """
+    return project_factory(authenticated_client, cached=True)
+
+
+@pytest.fixture(scope="module")
+def foreign_project(base_url, another_user_client):
+    """
+    Creates a project owned by a different user once per module.
+    
+    The project is only used to probe access control, so tests must not modify it.
+    
+    Args:
+        base_url: Base API URL
+        another_user_client: HTTP client authenticated as another test user
+        
+    Yields:
+        dict: Dictionary containing project details
+    """
     # Generate project data
     project_data = {
         "name": "Other User Project",
@@ -116,37 +137,34 @@ def other_user_project(base_url, test_client, another_user):
     }
     
     # Create project with another user's authentication
-    headers = {
-        "Authorization": f"Bearer {another_user['access_token']}",
-        "Content-Type": "application/json"
-    }
-    
-    response = test_client.post(
+    response = another_user_client.post(
         f"{base_url}/projects",
-        headers=headers,
         json=project_data
     )
     
     assert response.status_code == 201, f"Failed to create other user project: {response.text}"
     
-    return response.json()
+    project = orjson.loads(response.data)
+    yield project
+    
+    # Remove the project once the module is done
+    another_user_client.delete(f"{base_url}/projects/{project['id']}")
 
 
 @pytest.fixture
-def multiple_user_projects(base_url, authenticated_client, test_user):
+def multiple_user_projects(base_url, authenticated_client, created_projects, test_user):
     """
     Creates multiple projects for testing listing and filtering.
     
     Args:
         base_url: Base API URL
         authenticated_client: HTTP client with authentication
+        created_projects: Module-scoped tracker of created projects
         test_user: Test user fixture
         
     Returns:
         list: List of project dictionaries
     """
-    projects = []
-    
     # Create projects with different statuses and categories
     project_specs = [
         {"name": "Active Development Project", "status": "active", "category": "development"},
@@ -156,44 +174,40 @@ def multiple_user_projects(base_url, authenticated_client, test_user):
         {"name": "Completed Project", "status": "completed", "category": "marketing"}
     ]
     
-    for spec in project_specs:
-        project_data = {
-            "name": spec["name"],
-            "description": f"A {spec['status']} project for testing",
-            "category": spec["category"]
+    # Create all projects, directly in their target status, in a single request
+    response = authenticated_client.post(
+        f"{base_url}/projects/bulk",
+        json={
+            "projects": [
+                {
+                    "name": spec["name"],
+                    "description": f"A {spec['status']} project for testing",
+                    "category": spec["category"],
+                    "status": spec["status"]
+                }
+                for spec in project_specs
+            ]
         }
-        
-        # Create project
-        response = authenticated_client.post(
-            f"{base_url}/projects",
-            json=project_data
-        )
-        
-        assert response.status_code == 201, f"Failed to create project: {response.text}"
-        
-        # If created in non-active status, update the status
-        project = response.json()
-        if spec["status"] != "planning":  # Default is planning, so only update if different
-            status_response = authenticated_client.patch(
-                f"{base_url}/projects/{project['id']}/status",
-                json={"status": spec["status"]}
-            )
-            assert status_response.status_code == 200, f"Failed to update project status: {status_response.text}"
-            project = status_response.json()
-            
-        projects.append(project)
+    )
+    
+    assert response.status_code == 201, f"Failed to create projects: {response.text}"
+    
+    projects = orjson.loads(response.data)
+    for project in projects:
+        created_projects(authenticated_client, project["id"])
     
     return projects
 
 
 @pytest.fixture
-def project_with_tasks(base_url, authenticated_client, test_user):
+def project_with_tasks(base_url, authenticated_client, created_projects, test_user):
     """
     Creates a project with multiple tasks for testing project stats.
     
     Args:
         base_url: Base API URL
         authenticated_client: HTTP client with authentication
+        created_projects: Module-scoped tracker of created projects
         test_user: Test user fixture
         
     Returns:
@@ -213,11 +227,12 @@ def project_with_tasks(base_url, authenticated_client, test_user):
     
     assert project_response.status_code == 201, f"Failed to create project: {project_response.text}"
     
-    project = project_response.json()
+    project = orjson.loads(project_response.data)
+    created_projects(authenticated_client, project["id"])
     
     # Add tasks with different statuses
     task_specs = [
-        {"title": "Not Started Task", "status": "not_started"},
+        {"title": "Not Started Task", "status": "created"},
         {"title": "In Progress Task 1", "status": "in_progress"},
         {"title": "In Progress Task 2", "status": "in_progress"},
         {"title": "On Hold Task", "status": "on_hold"},
@@ -226,40 +241,31 @@ def project_with_tasks(base_url, authenticated_client, test_user):
         {"title": "Completed Task 3", "status": "completed"}
     ]
     
-    for spec in task_specs:
-        task_data = {
-            "title": spec["title"],
-            "description": f"A task for testing with status: {spec['status']}",
-            "status": "not_started",  # Start all as not started
-            "priority": "medium",
+    # Create all tasks, directly in their target status, in a single bulk call
+    tasks_response = authenticated_client.post(
+        f"{base_url}/tasks/bulk",
+        json={
             "projectId": project["id"],
-            "dueDate": None
+            "tasks": [
+                {
+                    "title": spec["title"],
+                    "description": f"A task for testing with status: {spec['status']}",
+                    "status": spec["status"],
+                    "priority": "medium",
+                    "dueDate": None
+                }
+                for spec in task_specs
+            ]
         }
-        
-        # Create task
-        task_response = authenticated_client.post(
-            f"{base_url}/tasks",
-            json=task_data
-        )
-        
-        assert task_response.status_code == 201, f"Failed to create task: {task_response.text}"
-        
-        task = task_response.json()
-        
-        # Update status if needed
-        if spec["status"] != "not_started":
-            status_response = authenticated_client.patch(
-                f"{base_url}/tasks/{task['id']}/status",
-                json={"status": spec["status"]}
-            )
-            
-            assert status_response.status_code == 200, f"Failed to update task status: {status_response.text}"
+    )
+    
+    assert tasks_response.status_code == 201, f"Failed to create tasks: {tasks_response.text}"
     
     # Return the project
     return project
 
 
-def test_project_creation_success(base_url, authenticated_client):
+def test_project_creation_success(base_url, authenticated_client, created_projects):
     """
     Tests successful project creation flow.
     """
@@ -280,7 +286,8 @@ def test_project_creation_success(base_url, authenticated_client):
     assert response.status_code == 201, f"Expected status code 201, got {response.status_code}: {response.text}"
     
     # Verify response data
-    project = response.json()
+    project = orjson.loads(response.data)
+    created_projects(authenticated_client, project["id"])
     assert project["name"] == project_data["name"]
     assert project["description"] == project_data["description"]
     assert project["status"] == "planning"  # Default status should be 'planning'
@@ -289,88 +296,187 @@ def test_project_creation_success(base_url, authenticated_client):
     assert "owner" in project
 
 
-def test_project_creation_validation(base_url, authenticated_client):
+@pytest.mark.parametrize("invalid_project,expected_field", [
+    # Missing name
+    ({"description": "Project without name", "category": "testing"}, "name"),
+    # Empty description (if required by API)
+    ({"name": "Project with Empty Description", "description": "", "category": "testing"}, "description"),
+    # Invalid status value
+    ({"name": "Project with Invalid Status", "description": "Testing invalid status",
+      "category": "testing", "status": "invalid_status"}, "status"),
+])
+def test_project_creation_validation(base_url, authenticated_client, invalid_project, expected_field):
     """
     Tests project creation with invalid data.
     """
-    # Test missing name
-    invalid_project = {
-        "description": "Project without name",
-        "category": "testing"
-    }
-    
-    response = authenticated_client.post(
-        f"{base_url}/projects",
-        json=invalid_project
-    )
-    
-    assert response.status_code == 400, f"Expected validation error for missing name, got {response.status_code}"
-    assert "name" in response.text.lower()
-    
-    # Test empty description (if required by API)
-    invalid_project = {
-        "name": "Project with Empty Description",
-        "description": "",
-        "category": "testing"
-    }
-    
     response = authenticated_client.post(
         f"{base_url}/projects",
         json=invalid_project
     )
     
-    assert response.status_code == 400, f"Expected validation error for empty description, got {response.status_code}"
-    assert "description" in response.text.lower()
-    
-    # Test invalid status value
-    invalid_project = {
-        "name": "Project with Invalid Status",
-        "description": "Testing invalid status",
-        "category": "testing",
-        "status": "invalid_status"
-    }
-    
-    response = authenticated_client.post(
-        f"{base_url}/projects",
-        json=invalid_project
-    )
-    
-    assert response.status_code == 400, f"Expected validation error for invalid status, got {response.status_code}"
-    assert "status" in response.text.lower()
+    assert response.status_code == 400, f"Expected validation error for {expected_field}, got {response.status_code}"
+    assert expected_field in response.text.lower()
 
 
-def test_get_project_details(base_url, authenticated_client, test_project):
+class TestProjectReads:
     """
-    Tests retrieving project details.
-    """
-    # Get project details
-    response = authenticated_client.get(
-        f"{base_url}/projects/{test_project['id']}"
-    )
-    
-    # Verify response
-    assert response.status_code == 200, f"Failed to get project details: {response.text}"
-    
-    project = response.json()
-    assert project["id"] == test_project["id"]
-    assert project["name"] == test_project["name"]
-    assert project["description"] == test_project["description"]
+    Tests sharing a single project.
     
-    # Verify all expected fields are present
-    expected_fields = ["id", "name", "description", "status", "owner", "members", 
-                      "createdAt", "updatedAt", "category"]
+    The tests only read the project or undo their changes on teardown, so they
+    reuse the module's cached shared_project instead of creating their own.
+    """
     
-    for field in expected_fields:
-        assert field in project, f"Expected field '{field}' missing from project response"
+    def test_get_project_details(self, base_url, authenticated_client, shared_project):
+        """
+        Tests retrieving project details.
+        """
+        # Get project details
+        response = authenticated_client.get(
+            f"{base_url}/projects/{shared_project['id']}"
+        )
+        
+        # Verify response
+        assert response.status_code == 200, f"Failed to get project details: {response.text}"
+        
+        project = orjson.loads(response.data)
+        assert project["id"] == shared_project["id"]
+        assert project["name"] == shared_project["name"]
+        assert project["description"] == shared_project["description"]
+        
+        # Verify all expected fields are present
+        expected_fields = ["id", "name", "description", "status", "owner", "members", 
+                          "createdAt", "updatedAt", "category"]
+        
+        for field in expected_fields:
+            assert field in project, f"Expected field '{field}' missing from project response"
+
+    def test_project_task_lists(self, base_url, authenticated_client, shared_project, request):
+        """
+        Tests adding, updating, and removing task lists.
+        """
+        # Task list names are unique so tests sharing the project do not clash
+        suffix = uuid.uuid4().hex[:8]
+        
+        # Create a task list
+        task_list_data = {
+            "name": f"Development Tasks {suffix}",
+            "description": "Tasks for the development phase"
+        }
+        
+        create_response = authenticated_client.post(
+            f"{base_url}/projects/{shared_project['id']}/tasklists",
+            json=task_list_data
+        )
+        
+        assert create_response.status_code == 201, f"Failed to create task list: {create_response.text}"
+        task_list = orjson.loads(create_response.data)
+        assert task_list["name"] == task_list_data["name"]
+        assert task_list["description"] == task_list_data["description"]
+        
+        # Store task list ID for later use and remove the list from the shared project afterwards
+        task_list_id = task_list["id"]
+        request.addfinalizer(lambda: authenticated_client.delete(
+            f"{base_url}/projects/{shared_project['id']}/tasklists/{task_list_id}"
+        ))
+        
+        # Create another task list
+        another_task_list_data = {
+            "name": f"Testing Tasks {suffix}",
+            "description": "Tasks for testing phase"
+        }
+        
+        another_create_response = authenticated_client.post(
+            f"{base_url}/projects/{shared_project['id']}/tasklists",
+            json=another_task_list_data
+        )
+        
+        assert another_create_response.status_code == 201, f"Failed to create second task list: {another_create_response.text}"
+        another_task_list = orjson.loads(another_create_response.data)
+        
+        # Update first task list
+        update_data = {
+            "name": f"Updated Development Tasks {suffix}"
+        }
+        
+        update_response = authenticated_client.put(
+            f"{base_url}/projects/{shared_project['id']}/tasklists/{task_list_id}",
+            json=update_data
+        )
+        
+        assert update_response.status_code == 200, f"Failed to update task list: {update_response.text}"
+        updated_task_list = orjson.loads(update_response.data)
+        assert updated_task_list["name"] == update_data["name"]
+        
+        # Delete second task list
+        delete_response = authenticated_client.delete(
+            f"{base_url}/projects/{shared_project['id']}/tasklists/{another_task_list['id']}"
+        )
+        
+        assert delete_response.status_code == 200, f"Failed to delete task list: {delete_response.text}"
+
+    def test_project_settings(self, base_url, authenticated_client, shared_project, request):
+        """
+        Tests updating project settings.
+        """
+        # Prepare settings data
+        settings_data = {
+            "workflow": {
+                "enableReview": True,
+                "allowSubtasks": True,
+                "defaultTaskStatus": "not_started"
+            },
+            "permissions": {
+                "memberInvite": "owner,manager",
+                "taskCreate": "owner,manager,member",
+                "commentCreate": "owner,manager,member,viewer"
+            },
+            "notifications": {
+                "taskCreate": True,
+                "taskComplete": True,
+                "commentAdd": False
+            }
+        }
+        
+        # Restore the shared project's original settings afterwards
+        original_settings = shared_project.get("settings", {})
+        request.addfinalizer(lambda: authenticated_client.put(
+            f"{base_url}/projects/{shared_project['id']}/settings",
+            json=original_settings
+        ))
+        
+        # Update project settings
+        response = authenticated_client.put(
+            f"{base_url}/projects/{shared_project['id']}/settings",
+            json=settings_data
+        )
+        
+        assert response.status_code == 200, f"Failed to update project settings: {response.text}"
+        updated_settings = orjson.loads(response.data)
+        
+        # Verify workflow settings
+        assert updated_settings["workflow"]["enableReview"] == settings_data["workflow"]["enableReview"]
+        assert updated_settings["workflow"]["allowSubtasks"] == settings_data["workflow"]["allowSubtasks"]
+        assert updated_settings["workflow"]["defaultTaskStatus"] == settings_data["workflow"]["defaultTaskStatus"]
+        
+        # Verify permissions settings
+        assert updated_settings["permissions"]["memberInvite"] == settings_data["permissions"]["memberInvite"]
+        assert updated_settings["permissions"]["taskCreate"] == settings_data["permissions"]["taskCreate"]
+        assert updated_settings["permissions"]["commentCreate"] == settings_data["permissions"]["commentCreate"]
+        
+        # Verify notifications settings if present
+        if "notifications" in updated_settings:
+            assert updated_settings["notifications"]["taskCreate"] == settings_data["notifications"]["taskCreate"]
+            assert updated_settings["notifications"]["taskComplete"] == settings_data["notifications"]["taskComplete"]
+            assert updated_settings["notifications"]["commentAdd"] == settings_data["notifications"]["commentAdd"]
 
 
-def test_get_project_unauthorized(base_url, authenticated_client, other_user_project):
+def test_get_project_unauthorized(base_url, authenticated_client, foreign_project):
     """
     Tests accessing project by unauthorized user.
     """
     # Attempt to access other user's project
     response = authenticated_client.get(
-        f"{base_url}/projects/{other_user_project['id']}"
+        f"{base_url}/projects/{foreign_project['id']}"
     )
     
     # Verify unauthorized response
@@ -398,24 +504,13 @@ def test_update_project(base_url, authenticated_client, test_project):
     # Verify response
     assert response.status_code == 200, f"Failed to update project: {response.text}"
     
-    updated_project = response.json()
+    updated_project = orjson.loads(response.data)
     assert updated_project["name"] == update_data["name"]
     assert updated_project["description"] == update_data["description"]
     assert updated_project["category"] == update_data["category"]
-    
-    # Verify persistence by getting the project again
-    get_response = authenticated_client.get(
-        f"{base_url}/projects/{test_project['id']}"
-    )
-    
-    assert get_response.status_code == 200
-    get_project = get_response.json()
-    assert get_project["name"] == update_data["name"]
-    assert get_project["description"] == update_data["description"]
-    assert get_project["category"] == update_data["category"]
 
 
-def test_update_project_unauthorized(base_url, authenticated_client, other_user_project):
+def test_update_project_unauthorized(base_url, authenticated_client, foreign_project):
     """
     Tests updating project by unauthorized user.
     """
@@ -428,7 +523,7 @@ def test_update_project_unauthorized(base_url, authenticated_client, other_user_
     
     # Attempt to update other user's project
     response = authenticated_client.put(
-        f"{base_url}/projects/{other_user_project['id']}",
+        f"{base_url}/projects/{foreign_project['id']}",
         json=update_data
     )
     
@@ -437,92 +532,62 @@ def test_update_project_unauthorized(base_url, authenticated_client, other_user_
     assert "permission" in response.text.lower() or "unauthorized" in response.text.lower()
 
 
-def test_project_status_transitions(base_url, authenticated_client, test_project):
+@pytest.mark.parametrize("from_status,to_status,expected_status_code", [
+    # Valid transitions
+    ("planning", "active", 200),
+    ("active", "on_hold", 200),
+    ("on_hold", "active", 200),
+    ("active", "completed", 200),
+    # Invalid transition
+    ("completed", "planning", 400),
+    # Invalid status value
+    ("planning", "invalid_status", 400),
+])
+def test_project_status_transitions(base_url, authenticated_client, project_factory, test_user,
+                                    from_status, to_status, expected_status_code):
     """
-    Tests project status transition flow.
+    Tests a single project status transition.
     """
-    # Verify initial status
-    assert test_project["status"] == "planning"
+    # Create a project already in the starting status
+    project = project_factory(authenticated_client, status=from_status)
+    assert project["status"] == from_status
     
-    # Test valid transitions
-    
-    # planning -> active
     status_response = authenticated_client.patch(
-        f"{base_url}/projects/{test_project['id']}/status",
-        json={"status": "active"}
+        f"{base_url}/projects/{project['id']}/status",
+        json={"status": to_status}
     )
     
-    assert status_response.status_code == 200, f"Failed to transition status to active: {status_response.text}"
-    assert status_response.json()["status"] == "active"
+    assert status_response.status_code == expected_status_code, \
+        f"Expected {expected_status_code} for {from_status} -> {to_status}, got {status_response.status_code}: {status_response.text}"
     
-    # active -> on_hold
-    status_response = authenticated_client.patch(
-        f"{base_url}/projects/{test_project['id']}/status",
-        json={"status": "on_hold"}
-    )
-    
-    assert status_response.status_code == 200, f"Failed to transition status to on_hold: {status_response.text}"
-    assert status_response.json()["status"] == "on_hold"
-    
-    # on_hold -> active
-    status_response = authenticated_client.patch(
-        f"{base_url}/projects/{test_project['id']}/status",
-        json={"status": "active"}
-    )
-    
-    assert status_response.status_code == 200, f"Failed to transition status back to active: {status_response.text}"
-    assert status_response.json()["status"] == "active"
-    
-    # active -> completed
-    status_response = authenticated_client.patch(
-        f"{base_url}/projects/{test_project['id']}/status",
-        json={"status": "completed"}
-    )
-    
-    assert status_response.status_code == 200, f"Failed to transition status to completed: {status_response.text}"
-    project = status_response.json()
-    assert project["status"] == "completed"
-    
-    # Verify completedAt is set
-    assert "completedAt" in project["metadata"], "completedAt should be set in project metadata when completed"
-    
-    # Test invalid transitions
-    
-    # completed -> planning (should fail)
-    status_response = authenticated_client.patch(
-        f"{base_url}/projects/{test_project['id']}/status",
-        json={"status": "planning"}
-    )
-    
-    assert status_response.status_code == 400, f"Expected 400 for invalid transition, got {status_response.status_code}"
-    
-    # Test invalid status value
-    status_response = authenticated_client.patch(
-        f"{base_url}/projects/{test_project['id']}/status",
-        json={"status": "invalid_status"}
-    )
-    
-    assert status_response.status_code == 400, f"Expected 400 for invalid status, got {status_response.status_code}"
+    if expected_status_code == 200:
+        updated_project = orjson.loads(status_response.data)
+        assert updated_project["status"] == to_status
+        
+        # Verify completedAt is set
+        if to_status == "completed":
+            assert "completedAt" in updated_project["metadata"], "completedAt should be set in project metadata when completed"
 
 
-def test_project_member_management(base_url, authenticated_client, test_project, another_user):
+def test_project_member_management(base_url, authenticated_client, shared_project, another_user):
     """
     Tests adding, updating, and removing project members.
     """
     # Add another user as a member
     member_data = {
-        "userId": another_user["id"],
+        "userId": another_user["_id"],
         "role": "member"
     }
     
     add_response = authenticated_client.post(
-        f"{base_url}/projects/{test_project['id']}/members",
+        f"{base_url}/projects/{shared_project['id']}/members",
         json=member_data
     )
     
     assert add_response.status_code == 201, f"Failed to add member: {add_response.text}"
-    assert add_response.json()["userId"] == another_user["id"]
-    assert add_response.json()["role"] == "member"
+    added_member = orjson.loads(add_response.data)
+    assert added_member["userId"] == another_user["_id"]
+    assert added_member["role"] == "member"
     
     # Update member role
     update_data = {
@@ -530,174 +595,87 @@ def test_project_member_management(base_url, authenticated_client, test_project,
     }
     
     update_response = authenticated_client.patch(
-        f"{base_url}/projects/{test_project['id']}/members/{another_user['id']}",
+        f"{base_url}/projects/{shared_project['id']}/members/{another_user['_id']}",
         json=update_data
     )
     
     assert update_response.status_code == 200, f"Failed to update member role: {update_response.text}"
-    assert update_response.json()["role"] == "manager"
+    assert orjson.loads(update_response.data)["role"] == "manager"
     
     # Get project members
     members_response = authenticated_client.get(
-        f"{base_url}/projects/{test_project['id']}/members"
+        f"{base_url}/projects/{shared_project['id']}/members"
     )
     
     assert members_response.status_code == 200, f"Failed to get project members: {members_response.text}"
-    members = members_response.json()
+    members = orjson.loads(members_response.data)
     
     # Verify both the owner and the added member are in the list
     member_ids = [m["userId"] for m in members]
-    assert another_user["id"] in member_ids, "Added member not found in members list"
+    assert another_user["_id"] in member_ids, "Added member not found in members list"
     
     # Remove the member
     remove_response = authenticated_client.delete(
-        f"{base_url}/projects/{test_project['id']}/members/{another_user['id']}"
+        f"{base_url}/projects/{shared_project['id']}/members/{another_user['_id']}"
     )
     
     assert remove_response.status_code == 200, f"Failed to remove member: {remove_response.text}"
     
     # Verify member was removed
     members_response = authenticated_client.get(
-        f"{base_url}/projects/{test_project['id']}/members"
+        f"{base_url}/projects/{shared_project['id']}/members"
     )
     
     assert members_response.status_code == 200
-    updated_members = members_response.json()
+    updated_members = orjson.loads(members_response.data)
     updated_member_ids = [m["userId"] for m in updated_members]
-    assert another_user["id"] not in updated_member_ids, "Member was not removed successfully"
+    assert another_user["_id"] not in updated_member_ids, "Member was not removed successfully"
 
 
-def test_project_task_lists(base_url, authenticated_client, test_project):
-    """
-    Tests adding, updating, and removing task lists.
+def test_project_write_read_roundtrip(base_url, authenticated_client, test_project):
     """
-    # Create a task list
-    task_list_data = {
-        "name": "Development Tasks",
-        "description": "Tasks for the development phase"
-    }
-    
-    create_response = authenticated_client.post(
-        f"{base_url}/projects/{test_project['id']}/tasklists",
-        json=task_list_data
-    )
-    
-    assert create_response.status_code == 201, f"Failed to create task list: {create_response.text}"
-    task_list = create_response.json()
-    assert task_list["name"] == task_list_data["name"]
-    assert task_list["description"] == task_list_data["description"]
-    
-    # Store task list ID for later use
-    task_list_id = task_list["id"]
+    Tests that project updates, settings and task list changes are persisted.
     
-    # Create another task list
-    another_task_list_data = {
-        "name": "Testing Tasks",
-        "description": "Tasks for testing phase"
-    }
-    
-    another_create_response = authenticated_client.post(
-        f"{base_url}/projects/{test_project['id']}/tasklists",
-        json=another_task_list_data
-    )
-    
-    assert another_create_response.status_code == 201, f"Failed to create second task list: {another_create_response.text}"
-    another_task_list = another_create_response.json()
+    The individual write tests trust the write responses; this test reads the
+    project back once to verify that all of those writes reached storage.
+    """
+    project_url = f"{base_url}/projects/{test_project['id']}"
     
-    # Update first task list
-    update_data = {
-        "name": "Updated Development Tasks"
-    }
+    # Update project details
+    update_data = {"name": "Roundtrip Project", "category": "development"}
+    response = authenticated_client.put(project_url, json=update_data)
+    assert response.status_code == 200, f"Failed to update project: {response.text}"
     
-    update_response = authenticated_client.put(
-        f"{base_url}/projects/{test_project['id']}/tasklists/{task_list_id}",
-        json=update_data
+    # Update project settings
+    response = authenticated_client.put(
+        f"{project_url}/settings",
+        json={"permissions": {"memberInvite": "owner,manager"}}
     )
+    assert response.status_code == 200, f"Failed to update project settings: {response.text}"
     
-    assert update_response.status_code == 200, f"Failed to update task list: {update_response.text}"
-    updated_task_list = update_response.json()
-    assert updated_task_list["name"] == update_data["name"]
-    
-    # Delete second task list
-    delete_response = authenticated_client.delete(
-        f"{base_url}/projects/{test_project['id']}/tasklists/{another_task_list['id']}"
-    )
+    # Add two task lists and delete one of them
+    kept_response = authenticated_client.post(f"{project_url}/tasklists", json={"name": "Kept Tasks"})
+    removed_response = authenticated_client.post(f"{project_url}/tasklists", json={"name": "Removed Tasks"})
+    assert kept_response.status_code == 201, f"Failed to create task list: {kept_response.text}"
+    assert removed_response.status_code == 201, f"Failed to create task list: {removed_response.text}"
+    kept_id = orjson.loads(kept_response.data)["id"]
+    removed_id = orjson.loads(removed_response.data)["id"]
     
+    delete_response = authenticated_client.delete(f"{project_url}/tasklists/{removed_id}")
     assert delete_response.status_code == 200, f"Failed to delete task list: {delete_response.text}"
     
-    # Get project details and verify task lists
-    project_response = authenticated_client.get(
-        f"{base_url}/projects/{test_project['id']}"
-    )
-    
+    # Read the project back once and verify every write
+    project_response = authenticated_client.get(project_url)
     assert project_response.status_code == 200
-    project = project_response.json()
+    project = orjson.loads(project_response.data)
     
-    # Check if task lists are correctly updated
-    task_list_ids = [tl["id"] for tl in project.get("taskLists", [])]
-    assert task_list_id in task_list_ids, "First task list should still be present"
-    assert another_task_list["id"] not in task_list_ids, "Second task list should be deleted"
-
-
-def test_project_settings(base_url, authenticated_client, test_project):
-    """
-    Tests updating project settings.
-    """
-    # Prepare settings data
-    settings_data = {
-        "workflow": {
-            "enableReview": True,
-            "allowSubtasks": True,
-            "defaultTaskStatus": "not_started"
-        },
-        "permissions": {
-            "memberInvite": "owner,manager",
-            "taskCreate": "owner,manager,member",
-            "commentCreate": "owner,manager,member,viewer"
-        },
-        "notifications": {
-            "taskCreate": True,
-            "taskComplete": True,
-            "commentAdd": False
-        }
-    }
+    assert project["name"] == update_data["name"]
+    assert project["category"] == update_data["category"]
+    assert project["settings"]["permissions"]["memberInvite"] == "owner,manager"
     
-    # Update project settings
-    response = authenticated_client.put(
-        f"{base_url}/projects/{test_project['id']}/settings",
-        json=settings_data
-    )
-    
-    assert response.status_code == 200, f"Failed to update project settings: {response.text}"
-    updated_settings = response.json()
-    
-    # Verify workflow settings
-    assert updated_settings["workflow"]["enableReview"] == settings_data["workflow"]["enableReview"]
-    assert updated_settings["workflow"]["allowSubtasks"] == settings_data["workflow"]["allowSubtasks"]
-    assert updated_settings["workflow"]["defaultTaskStatus"] == settings_data["workflow"]["defaultTaskStatus"]
-    
-    # Verify permissions settings
-    assert updated_settings["permissions"]["memberInvite"] == settings_data["permissions"]["memberInvite"]
-    assert updated_settings["permissions"]["taskCreate"] == settings_data["permissions"]["taskCreate"]
-    assert updated_settings["permissions"]["commentCreate"] == settings_data["permissions"]["commentCreate"]
-    
-    # Verify notifications settings if present
-    if "notifications" in updated_settings:
-        assert updated_settings["notifications"]["taskCreate"] == settings_data["notifications"]["taskCreate"]
-        assert updated_settings["notifications"]["taskComplete"] == settings_data["notifications"]["taskComplete"]
-        assert updated_settings["notifications"]["commentAdd"] == settings_data["notifications"]["commentAdd"]
-    
-    # Get project details and verify settings
-    project_response = authenticated_client.get(
-        f"{base_url}/projects/{test_project['id']}"
-    )
-    
-    assert project_response.status_code == 200
-    project = project_response.json()
-    
-    # Verify settings are saved in project
-    assert project["settings"]["workflow"]["enableReview"] == settings_data["workflow"]["enableReview"]
-    assert project["settings"]["permissions"]["memberInvite"] == settings_data["permissions"]["memberInvite"]
+    task_list_ids = [tl["id"] for tl in project.get("taskLists", [])]
+    assert kept_id in task_list_ids, "Kept task list should still be present"
+    assert removed_id not in task_list_ids, "Removed task list should be deleted"
 
 
 def test_list_user_projects(base_url, authenticated_client, multiple_user_projects):
@@ -709,51 +687,45 @@ def test_list_user_projects(base_url, authenticated_client, multiple_user_projec
     
     assert response.status_code == 200, f"Failed to list projects: {response.text}"
     
-    projects = response.json()
+    projects = orjson.loads(response.data)
     assert isinstance(projects, list), "Expected a list of projects"
     assert len(projects) >= len(multiple_user_projects), "Should return at least the created test projects"
     
-    # Test filtering by status
-    status_response = authenticated_client.get(f"{base_url}/projects?status=active")
+    # Test filtering by status together with pagination; the fixture creates two active projects
+    page_response = authenticated_client.get(f"{base_url}/projects?status=active&page=1&per_page=2")
     
-    assert status_response.status_code == 200
-    active_projects = status_response.json()
+    assert page_response.status_code == 200
+    active_projects = orjson.loads(page_response.data)
     
     # Verify that all returned projects have active status
     for project in active_projects:
         assert project["status"] == "active", f"Project with status {project['status']} in active filter results"
     
+    # Verify pagination
+    assert len(active_projects) <= 2, "Page size should limit results to 2 projects"
+    
+    # Check for pagination headers
+    assert "X-Pagination-Page" in page_response.headers, "Pagination header X-Pagination-Page missing"
+    assert "X-Pagination-Per-Page" in page_response.headers, "Pagination header X-Pagination-Per-Page missing"
+    assert "X-Pagination-Total" in page_response.headers, "Pagination header X-Pagination-Total missing"
+    
     # Test filtering by category
     category_response = authenticated_client.get(f"{base_url}/projects?category=development")
     
     assert category_response.status_code == 200
-    dev_projects = category_response.json()
+    dev_projects = orjson.loads(category_response.data)
     
     # Verify that all returned projects have development category
     for project in dev_projects:
         assert project["category"] == "development", f"Project with category {project['category']} in development filter results"
-    
-    # Test pagination
-    page_response = authenticated_client.get(f"{base_url}/projects?page=1&per_page=2")
-    
-    assert page_response.status_code == 200
-    paged_projects = page_response.json()
-    
-    # Verify pagination
-    assert len(paged_projects) <= 2, "Page size should limit results to 2 projects"
-    
-    # Check for pagination headers
-    assert "X-Pagination-Page" in page_response.headers, "Pagination header X-Pagination-Page missing"
-    assert "X-Pagination-Per-Page" in page_response.headers, "Pagination header X-Pagination-Per-Page missing"
-    assert "X-Pagination-Total" in page_response.headers, "Pagination header X-Pagination-Total missing"
 
 
-def test_search_projects(base_url, authenticated_client, multiple_user_projects):
+def test_search_projects(base_url, authenticated_client, created_projects, multiple_user_projects):
     """
     Tests searching for projects with various criteria.
     """
     # Create a recognizable project for testing search
-    unique_keyword = f"unique_search_term_{int(time.time())}"
+    unique_keyword = f"unique_search_term_{RUN_ID}_{uuid.uuid4().hex[:6]}"
     search_project_data = {
         "name": f"Searchable Project with {unique_keyword}",
         "description": "A project specifically for testing search functionality",
@@ -766,6 +738,7 @@ def test_search_projects(base_url, authenticated_client, multiple_user_projects)
     )
     
     assert create_response.status_code == 201, f"Failed to create search test project: {create_response.text}"
+    created_projects(authenticated_client, orjson.loads(create_response.data)["id"])
     
     # Basic search by keyword
     search_response = authenticated_client.get(
@@ -773,7 +746,7 @@ def test_search_projects(base_url, authenticated_client, multiple_user_projects)
     )
     
     assert search_response.status_code == 200, f"Search request failed: {search_response.text}"
-    search_results = search_response.json()
+    search_results = orjson.loads(search_response.data)
     
     # Verify keyword search works
     assert len(search_results) >= 1, "Expected at least one result for keyword search"
@@ -787,7 +760,7 @@ def test_search_projects(base_url, authenticated_client, multiple_user_projects)
     )
     
     assert combined_response.status_code == 200
-    combined_results = combined_response.json()
+    combined_results = orjson.loads(combined_response.data)
     
     # Verify combined filters work
     for project in combined_results:
@@ -806,7 +779,7 @@ def test_project_stats(base_url, authenticated_client, project_with_tasks):
     
     assert response.status_code == 200, f"Failed to get project stats: {response.text}"
     
-    stats = response.json()
+    stats = orjson.loads(response.data)
     
     # Verify task statistics
     assert "taskStats" in stats, "Expected taskStats in response"
@@ -840,7 +813,7 @@ def test_project_deletion(base_url, authenticated_client, test_project):
     )
     
     assert response.status_code == 200, f"Failed to delete project: {response.text}"
-    assert "success" in response.json(), "Expected success message in response"
+    assert "success" in orjson.loads(response.data), "Expected success message in response"
     
     # Verify project is archived, not hard-deleted
     get_response = authenticated_client.get(
@@ -848,5 +821,5 @@ def test_project_deletion(base_url, authenticated_client, test_project):
     )
     
     assert get_response.status_code == 200, "Project should still be accessible after soft-delete"
-    project = get_response.json()
+    project = orjson.loads(get_response.data)
     assert project["status"] == "archived", "Project status should be changed to 'archived'"
\ No newline at end of file
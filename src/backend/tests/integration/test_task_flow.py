@@ -7,55 +7,83 @@ that the API endpoints function correctly with proper authorization.
 """
 
 import pytest
-import json
 import datetime
-import time
-import requests
+import orjson
+import re
 
 # Fixtures and utilities from conftest
 from conftest import (
     base_url,
-    test_client,
     authenticated_client,
     authenticated_admin_client,
     test_user,
     test_admin,
     test_project,
     authenticated_user_headers,
-    authenticated_admin_headers
+    authenticated_admin_headers,
+    create_api_factory,
+    create_test_project
 )
 
+# Statuses and priorities cycled through by multiple_user_tasks
+_STATUSES = ("created", "assigned", "in_progress", "on_hold", "completed")
+_PRIORITIES = ("low", "medium", "high", "urgent")
+
 # Fixtures for testing
 
-@pytest.fixture
-def test_task(base_url, authenticated_client, test_user):
+@pytest.fixture(scope="module")
+def task_factory(base_url):
     """
-    Creates a test task for the authenticated user.
+    Creates tasks on demand for the tests in this module.
     
-    Returns a dictionary containing the task data.
+    Tasks requested with cached=True are created once and reused by every
+    read-only test asking for the same data. Returns a factory taking an
+    authenticated client and task field overrides.
     """
-    task_data = {
-        "title": "Test Task",
-        "description": "This is a test task for integration testing",
-        "priority": "medium",
-        "status": "created"
-    }
-    
-    response = authenticated_client.post(
-        f"{base_url}/tasks", 
-        json=task_data
+    return create_api_factory(
+        base_url,
+        "tasks",
+        {
+            "title": "Test Task",
+            "description": "This is a test task for integration testing",
+            "priority": "medium",
+            "status": "created"
+        }
     )
+
+@pytest.fixture
+def test_task(task_factory, authenticated_client, test_user):
+    """
+    Creates a fresh test task for the authenticated user.
     
-    assert response.status_code == 201
-    return json.loads(response.data)
+    Use this for tests that mutate the task. Returns a dictionary containing the task data.
+    """
+    return task_factory(authenticated_client)
 
 @pytest.fixture
-def other_user_task(base_url, test_client, another_user):
+def task_url(base_url, test_task):
     """
-    Creates a task owned by a different user.
+    Returns the URL of test_task, built once per test.
+    """
+    return f"{base_url}/tasks/{test_task['_id']}"
+
+@pytest.fixture
+def shared_task(task_factory, authenticated_client, test_user):
+    """
+    Returns a test task shared by the read-only tests of this module.
     
     Returns a dictionary containing the task data.
     """
+    return task_factory(authenticated_client, cached=True)
+
+@pytest.fixture(scope="module")
+def foreign_task(base_url, another_user_client):
+    """
+    Creates a task owned by a different user once per module.
+    
+    The task is only used to probe access control, so tests must not modify it.
+    Yields a dictionary containing the task data.
+    """
     task_data = {
         "title": "Other User Task",
         "description": "This task belongs to another user",
@@ -63,202 +91,153 @@ def other_user_task(base_url, test_client, another_user):
         "status": "created"
     }
     
-    headers = {
-        "Authorization": f"Bearer {another_user['access_token']}",
-        "Content-Type": "application/json"
-    }
-    
-    response = test_client.post(
+    response = another_user_client.post(
         f"{base_url}/tasks", 
-        json=task_data,
-        headers=headers
+        json=task_data
     )
     
     assert response.status_code == 201
-    return json.loads(response.data)
+    task = orjson.loads(response.data)
+    yield task
+    
+    # Remove the task once the module is done
+    another_user_client.delete(f"{base_url}/tasks/{task['_id']}")
 
 @pytest.fixture
-def another_user(base_url, test_client):
+def second_test_task(task_factory, authenticated_client, test_user):
     """
-    Creates another test user for assignment testing.
+    Creates a second test task for dependency testing.
     
-    Returns a dictionary with user details and authentication tokens.
+    Returns a dictionary containing the task data.
     """
-    user_data = {
-        "email": f"another_user_{int(time.time())}@example.com",
-        "password": "SecurePassword123!",
-        "firstName": "Another",
-        "lastName": "User"
-    }
-    
-    # Register the user
-    response = test_client.post(
-        f"{base_url}/auth/register",
-        json=user_data
+    return task_factory(
+        authenticated_client,
+        title="Dependent Task",
+        description="This is a task for testing dependencies",
+        priority="high"
     )
+
+def _utc_iso(value):
+    """
+    Drops the UTC suffix from an ISO-8601 timestamp.
     
-    assert response.status_code == 201
-    user_response = json.loads(response.data)
-    
-    # Login to get tokens
-    login_data = {
-        "email": user_data["email"],
-        "password": user_data["password"]
-    }
+    The result compares lexically, in time order, with naive
+    datetime.utcnow().isoformat() strings.
+    """
+    return value.replace("Z", "").replace("+00:00", "")
+
+def _bulk_create_tasks(client, base_url, task_payloads):
+    """
+    Creates several tasks with a single request to the bulk endpoint.
     
-    login_response = test_client.post(
-        f"{base_url}/auth/login",
-        json=login_data
+    Returns the created task dictionaries in the order of task_payloads.
+    """
+    response = client.post(
+        f"{base_url}/tasks/bulk", 
+        json={"tasks": task_payloads}
     )
     
-    assert login_response.status_code == 200
-    tokens = json.loads(login_response.data)
-    
-    # Combine user data with tokens
-    user_response.update(tokens)
-    return user_response
+    assert response.status_code == 201
+    return orjson.loads(response.data)
 
-@pytest.fixture
-def second_test_task(base_url, authenticated_client, test_user):
+@pytest.fixture(scope="module")
+def listing_project(mongo_db, test_user):
     """
-    Creates a second test task for dependency testing.
+    Creates a project owned by the test user for the task sets of this module.
     
-    Returns a dictionary containing the task data.
+    Returns a dictionary containing the project data.
     """
-    task_data = {
-        "title": "Dependent Task",
-        "description": "This is a task for testing dependencies",
-        "priority": "high",
-        "status": "created"
-    }
-    
-    response = authenticated_client.post(
-        f"{base_url}/tasks", 
-        json=task_data
+    return create_test_project(
+        mongo_db,
+        name="Task Listing Project",
+        description="Project holding tasks created for listing and search tests",
+        owner=test_user
     )
-    
-    assert response.status_code == 201
-    return json.loads(response.data)
 
-@pytest.fixture
-def multiple_user_tasks(base_url, authenticated_client, test_user, test_project):
+@pytest.fixture(scope="module")
+def multiple_user_tasks(base_url, authenticated_client, test_user, listing_project):
     """
-    Creates multiple tasks for testing listing and filtering.
+    Creates multiple tasks for testing listing and filtering, once per module.
     
     Returns a list of task dictionaries with various statuses, priorities, and due dates.
     """
-    tasks = []
-    
-    # Create tasks with different statuses
-    statuses = ["created", "assigned", "in_progress", "on_hold", "completed"]
-    priorities = ["low", "medium", "high", "urgent"]
+    now = datetime.datetime.utcnow()
     
-    for i in range(10):
-        status = statuses[i % len(statuses)]
-        priority = priorities[i % len(priorities)]
-        
-        # Set different due dates
-        days_offset = i - 5  # Some past, some future
-        due_date = (datetime.datetime.utcnow() + datetime.timedelta(days=days_offset)).isoformat()
-        
-        task_data = {
+    # Tasks cycle through the statuses and priorities, with due dates
+    # ranging from 5 days ago to 4 days ahead
+    task_payloads = [
+        {
             "title": f"Task {i+1}",
             "description": f"Description for task {i+1}",
-            "status": status,
-            "priority": priority,
-            "dueDate": due_date,
-            "projectId": test_project["_id"] if i % 2 == 0 else None
+            "status": _STATUSES[i % len(_STATUSES)],
+            "priority": _PRIORITIES[i % len(_PRIORITIES)],
+            "dueDate": (now + datetime.timedelta(days=i - 5)).isoformat(),
+            "projectId": listing_project["_id"] if i % 2 == 0 else None
         }
-        
-        response = authenticated_client.post(
-            f"{base_url}/tasks", 
-            json=task_data
-        )
-        
-        assert response.status_code == 201
-        tasks.append(json.loads(response.data))
+        for i in range(10)
+    ]
     
-    return tasks
+    return _bulk_create_tasks(authenticated_client, base_url, task_payloads)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tasks_with_due_dates(base_url, authenticated_client, test_user):
     """
-    Creates tasks with past, soon, and future due dates.
+    Creates tasks with past, soon, and future due dates, once per module.
     
     Returns a dictionary with categorized task lists.
     """
     now = datetime.datetime.utcnow()
     
-    # Create overdue tasks (in the past)
-    overdue_tasks = []
-    for i in range(3):
-        days_ago = i + 1
-        due_date = (now - datetime.timedelta(days=days_ago)).isoformat()
-        
-        task_data = {
+    # Overdue tasks, 1 to 3 days in the past
+    overdue_payloads = [
+        {
             "title": f"Overdue Task {i+1}",
             "description": f"This task is overdue by {days_ago} days",
             "priority": "high",
-            "dueDate": due_date,
+            "dueDate": (now - datetime.timedelta(days=days_ago)).isoformat(),
             "status": "in_progress"
         }
-        
-        response = authenticated_client.post(
-            f"{base_url}/tasks", 
-            json=task_data
-        )
-        
-        assert response.status_code == 201
-        overdue_tasks.append(json.loads(response.data))
-    
-    # Create tasks due soon (next 24 hours)
-    due_soon_tasks = []
-    for i in range(3):
-        hours_future = i * 8  # 0, 8, 16 hours in the future
-        due_date = (now + datetime.timedelta(hours=hours_future)).isoformat()
-        
-        task_data = {
+        for i, days_ago in enumerate((1, 2, 3))
+    ]
+    
+    # Tasks due soon, 0, 8 and 16 hours in the future
+    due_soon_payloads = [
+        {
             "title": f"Due Soon Task {i+1}",
             "description": f"This task is due in {hours_future} hours",
             "priority": "medium",
-            "dueDate": due_date,
+            "dueDate": (now + datetime.timedelta(hours=hours_future)).isoformat(),
             "status": "in_progress"
         }
-        
-        response = authenticated_client.post(
-            f"{base_url}/tasks", 
-            json=task_data
-        )
-        
-        assert response.status_code == 201
-        due_soon_tasks.append(json.loads(response.data))
-    
-    # Create future tasks (more than 48 hours)
-    future_tasks = []
-    for i in range(3):
-        days_future = i + 3  # 3, 4, 5 days in the future
-        due_date = (now + datetime.timedelta(days=days_future)).isoformat()
-        
-        task_data = {
+        for i, hours_future in enumerate((0, 8, 16))
+    ]
+    
+    # Future tasks, 3 to 5 days in the future
+    future_payloads = [
+        {
             "title": f"Future Task {i+1}",
             "description": f"This task is due in {days_future} days",
             "priority": "low",
-            "dueDate": due_date,
+            "dueDate": (now + datetime.timedelta(days=days_future)).isoformat(),
             "status": "created"
         }
-        
-        response = authenticated_client.post(
-            f"{base_url}/tasks", 
-            json=task_data
-        )
-        
-        assert response.status_code == 201
-        future_tasks.append(json.loads(response.data))
+        for i, days_future in enumerate((3, 4, 5))
+    ]
+    
+    # Create all tasks in one request and split the results back by category
+    tasks = _bulk_create_tasks(
+        authenticated_client,
+        base_url,
+        overdue_payloads + due_soon_payloads + future_payloads
+    )
+    
+    overdue_end = len(overdue_payloads)
+    due_soon_end = overdue_end + len(due_soon_payloads)
     
     return {
-        "overdue": overdue_tasks,
-        "due_soon": due_soon_tasks,
-        "future": future_tasks
+        "overdue": tasks[:overdue_end],
+        "due_soon": tasks[overdue_end:due_soon_end],
+        "future": tasks[due_soon_end:]
     }
 
 # Test cases
@@ -284,7 +263,7 @@ def test_task_creation_success(base_url, authenticated_client):
     assert response.status_code == 201
     
     # Parse response data
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     
     # Verify task data
     assert task["title"] == task_data["title"]
@@ -323,7 +302,7 @@ def test_task_creation_with_project(base_url, authenticated_client, test_project
     assert response.status_code == 201
     
     # Parse response data
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     
     # Verify project association
     assert task["projectId"] == test_project["_id"]
@@ -334,11 +313,10 @@ def test_task_creation_with_project(base_url, authenticated_client, test_project
     )
     
     assert project_tasks_response.status_code == 200
-    project_tasks = json.loads(project_tasks_response.data)
+    project_tasks = orjson.loads(project_tasks_response.data)
     
     # Find our task in the project tasks
-    task_found = any(t["_id"] == task["_id"] for t in project_tasks["items"])
-    assert task_found
+    assert task["_id"] in {t["_id"] for t in project_tasks["items"]}
 
 def test_task_creation_validation(base_url, authenticated_client):
     """
@@ -357,7 +335,7 @@ def test_task_creation_validation(base_url, authenticated_client):
     
     # Verify validation error
     assert response.status_code == 400
-    error_data = json.loads(response.data)
+    error_data = orjson.loads(response.data)
     assert "title" in error_data.get("errors", {})
     
     # Test creating task with invalid status
@@ -374,7 +352,7 @@ def test_task_creation_validation(base_url, authenticated_client):
     
     # Verify validation error
     assert response.status_code == 400
-    error_data = json.loads(response.data)
+    error_data = orjson.loads(response.data)
     assert "status" in error_data.get("errors", {})
     
     # Test creating task with invalid priority
@@ -391,30 +369,30 @@ def test_task_creation_validation(base_url, authenticated_client):
     
     # Verify validation error
     assert response.status_code == 400
-    error_data = json.loads(response.data)
+    error_data = orjson.loads(response.data)
     assert "priority" in error_data.get("errors", {})
 
-def test_get_task_details(base_url, authenticated_client, test_task):
+def test_get_task_details(base_url, authenticated_client, shared_task):
     """
     Tests retrieving task details.
     """
     # Get task details
     response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
+        f"{base_url}/tasks/{shared_task['_id']}"
     )
     
     # Verify response status code
     assert response.status_code == 200
     
     # Parse response data
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     
     # Verify task data matches
-    assert task["_id"] == test_task["_id"]
-    assert task["title"] == test_task["title"]
-    assert task["description"] == test_task["description"]
-    assert task["status"] == test_task["status"]
-    assert task["priority"] == test_task["priority"]
+    assert task["_id"] == shared_task["_id"]
+    assert task["title"] == shared_task["title"]
+    assert task["description"] == shared_task["description"]
+    assert task["status"] == shared_task["status"]
+    assert task["priority"] == shared_task["priority"]
     
     # Verify all expected fields are present
     expected_fields = [
@@ -425,23 +403,23 @@ def test_get_task_details(base_url, authenticated_client, test_task):
     for field in expected_fields:
         assert field in task
 
-def test_get_task_unauthorized(base_url, authenticated_client, other_user_task):
+def test_get_task_unauthorized(base_url, authenticated_client, foreign_task):
     """
     Tests attempting to access a task created by another user.
     """
     # Try to access task created by another user
     response = authenticated_client.get(
-        f"{base_url}/tasks/{other_user_task['_id']}"
+        f"{base_url}/tasks/{foreign_task['_id']}"
     )
     
     # Verify access is denied
     assert response.status_code == 403
     
     # Parse error response
-    error_data = json.loads(response.data)
+    error_data = orjson.loads(response.data)
     assert "authorization" in error_data.get("code", "").lower()
 
-def test_update_task(base_url, authenticated_client, test_task):
+def test_update_task(authenticated_client, task_url):
     """
     Tests updating task details.
     """
@@ -455,7 +433,7 @@ def test_update_task(base_url, authenticated_client, test_task):
     
     # Update the task
     response = authenticated_client.put(
-        f"{base_url}/tasks/{test_task['_id']}",
+        task_url,
         json=updated_data
     )
     
@@ -463,7 +441,7 @@ def test_update_task(base_url, authenticated_client, test_task):
     assert response.status_code == 200
     
     # Parse response data
-    updated_task = json.loads(response.data)
+    updated_task = orjson.loads(response.data)
     
     # Verify updated fields
     assert updated_task["title"] == updated_data["title"]
@@ -473,95 +451,55 @@ def test_update_task(base_url, authenticated_client, test_task):
     
     # Verify update was persisted by fetching task again
     get_response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
+        task_url
     )
     
     assert get_response.status_code == 200
-    fetched_task = json.loads(get_response.data)
+    fetched_task = orjson.loads(get_response.data)
     
     assert fetched_task["title"] == updated_data["title"]
     assert fetched_task["description"] == updated_data["description"]
     assert fetched_task["priority"] == updated_data["priority"]
 
-def test_task_status_transitions(base_url, authenticated_client, test_task):
+@pytest.mark.parametrize("from_status,to_status,expected_status_code", [
+    # Valid transitions
+    ("created", "assigned", 200),
+    ("assigned", "in_progress", 200),
+    ("in_progress", "on_hold", 200),
+    ("on_hold", "in_progress", 200),
+    ("in_progress", "completed", 200),
+    # Invalid transition
+    ("completed", "in_progress", 400),
+    # Invalid status value
+    ("created", "invalid_status", 400),
+])
+def test_task_status_transitions(base_url, authenticated_client, task_factory, test_user,
+                                 from_status, to_status, expected_status_code):
     """
-    Tests the task status transition workflow.
+    Tests a single task status transition.
     """
-    # Verify initial status
-    assert test_task["status"] == "created"
-    
-    # Test transition: created -> assigned
-    response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/status",
-        json={"status": "assigned"}
-    )
-    
-    assert response.status_code == 200
-    updated_task = json.loads(response.data)
-    assert updated_task["status"] == "assigned"
-    
-    # Test transition: assigned -> in_progress
-    response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/status",
-        json={"status": "in_progress"}
-    )
-    
-    assert response.status_code == 200
-    updated_task = json.loads(response.data)
-    assert updated_task["status"] == "in_progress"
-    
-    # Test transition: in_progress -> on_hold
-    response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/status",
-        json={"status": "on_hold"}
-    )
-    
-    assert response.status_code == 200
-    updated_task = json.loads(response.data)
-    assert updated_task["status"] == "on_hold"
-    
-    # Test transition: on_hold -> in_progress
-    response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/status",
-        json={"status": "in_progress"}
-    )
+    # Create a task already in the starting status
+    task = task_factory(authenticated_client, status=from_status)
+    assert task["status"] == from_status
     
-    assert response.status_code == 200
-    updated_task = json.loads(response.data)
-    assert updated_task["status"] == "in_progress"
-    
-    # Test transition: in_progress -> completed
-    response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/status",
-        json={"status": "completed"}
-    )
-    
-    assert response.status_code == 200
-    updated_task = json.loads(response.data)
-    assert updated_task["status"] == "completed"
-    assert "completedAt" in updated_task["metadata"]
-    
-    # Test invalid transition: completed -> in_progress (should fail)
     response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/status",
-        json={"status": "in_progress"}
+        f"{base_url}/tasks/{task['_id']}/status",
+        json={"status": to_status}
     )
     
-    assert response.status_code == 400
-    error_data = json.loads(response.data)
-    assert "status" in error_data.get("errors", {})
-    
-    # Test invalid status value
-    response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/status",
-        json={"status": "invalid_status"}
-    )
+    assert response.status_code == expected_status_code
+    body = orjson.loads(response.data)
     
-    assert response.status_code == 400
-    error_data = json.loads(response.data)
-    assert "status" in error_data.get("errors", {})
+    if expected_status_code == 200:
+        assert body["status"] == to_status
+        
+        # Verify completedAt is set
+        if to_status == "completed":
+            assert "completedAt" in body["metadata"]
+    else:
+        assert "status" in body.get("errors", {})
 
-def test_task_assignment(base_url, authenticated_client, test_task, another_user):
+def test_task_assignment(base_url, authenticated_client, test_task, task_url, another_user, another_user_client):
     """
     Tests assigning a task to a user.
     """
@@ -570,7 +508,7 @@ def test_task_assignment(base_url, authenticated_client, test_task, another_user
     
     # Assign the task to another user
     response = authenticated_client.patch(
-        f"{base_url}/tasks/{test_task['_id']}/assign",
+        f"{task_url}/assign",
         json={"assigneeId": another_user["_id"]}
     )
     
@@ -578,7 +516,7 @@ def test_task_assignment(base_url, authenticated_client, test_task, another_user
     assert response.status_code == 200
     
     # Parse response data
-    updated_task = json.loads(response.data)
+    updated_task = orjson.loads(response.data)
     
     # Verify assignment
     assert updated_task["assigneeId"] == another_user["_id"]
@@ -587,24 +525,16 @@ def test_task_assignment(base_url, authenticated_client, test_task, another_user
     if test_task["status"] == "created":
         assert updated_task["status"] == "assigned"
     
-    # Verify task appears in the assigned user's task list
-    # We need to use the another_user's authentication token for this
-    headers = {
-        "Authorization": f"Bearer {another_user['access_token']}",
-        "Content-Type": "application/json"
-    }
-    
-    assigned_tasks_response = test_client.get(
-        f"{base_url}/tasks?assignedTo={another_user['_id']}",
-        headers=headers
+    # Verify task appears in the assigned user's task list, as seen by that user
+    assigned_tasks_response = another_user_client.get(
+        f"{base_url}/tasks?assignedTo={another_user['_id']}"
     )
     
     assert assigned_tasks_response.status_code == 200
-    assigned_tasks = json.loads(assigned_tasks_response.data)
+    assigned_tasks = orjson.loads(assigned_tasks_response.data)
     
     # Find our task in the assigned tasks
-    task_found = any(t["_id"] == test_task["_id"] for t in assigned_tasks["items"])
-    assert task_found
+    assert test_task["_id"] in {t["_id"] for t in assigned_tasks["items"]}
 
 def test_list_user_tasks(base_url, authenticated_client, multiple_user_tasks):
     """
@@ -616,7 +546,7 @@ def test_list_user_tasks(base_url, authenticated_client, multiple_user_tasks):
     )
     
     assert response.status_code == 200
-    task_list = json.loads(response.data)
+    task_list = orjson.loads(response.data)
     
     # Verify response contains expected structure
     assert "items" in task_list
@@ -633,11 +563,10 @@ def test_list_user_tasks(base_url, authenticated_client, multiple_user_tasks):
     )
     
     assert in_progress_response.status_code == 200
-    in_progress_tasks = json.loads(in_progress_response.data)
+    in_progress_tasks = orjson.loads(in_progress_response.data)
     
     # Verify all tasks have the correct status
-    for task in in_progress_tasks["items"]:
-        assert task["status"] == "in_progress"
+    assert {task["status"] for task in in_progress_tasks["items"]} <= {"in_progress"}
     
     # Test filtering by priority
     high_priority_response = authenticated_client.get(
@@ -645,11 +574,10 @@ def test_list_user_tasks(base_url, authenticated_client, multiple_user_tasks):
     )
     
     assert high_priority_response.status_code == 200
-    high_priority_tasks = json.loads(high_priority_response.data)
+    high_priority_tasks = orjson.loads(high_priority_response.data)
     
     # Verify all tasks have the correct priority
-    for task in high_priority_tasks["items"]:
-        assert task["priority"] == "high"
+    assert {task["priority"] for task in high_priority_tasks["items"]} <= {"high"}
     
     # Test filtering by due date range
     now = datetime.datetime.utcnow()
@@ -661,14 +589,14 @@ def test_list_user_tasks(base_url, authenticated_client, multiple_user_tasks):
     )
     
     assert date_range_response.status_code == 200
-    date_range_tasks = json.loads(date_range_response.data)
+    date_range_tasks = orjson.loads(date_range_response.data)
     
     # Verify due dates are within range (if due date is set)
-    for task in date_range_tasks["items"]:
-        if "dueDate" in task and task["dueDate"]:
-            task_date = datetime.datetime.fromisoformat(task["dueDate"].replace("Z", "+00:00"))
-            assert task_date >= now - datetime.timedelta(days=2)
-            assert task_date <= now + datetime.timedelta(days=2)
+    out_of_range = [
+        task["dueDate"] for task in date_range_tasks["items"]
+        if task.get("dueDate") and not start_date <= _utc_iso(task["dueDate"]) <= end_date
+    ]
+    assert not out_of_range
     
     # Test pagination
     paginated_response = authenticated_client.get(
@@ -676,7 +604,7 @@ def test_list_user_tasks(base_url, authenticated_client, multiple_user_tasks):
     )
     
     assert paginated_response.status_code == 200
-    paginated_tasks = json.loads(paginated_response.data)
+    paginated_tasks = orjson.loads(paginated_response.data)
     
     # Verify pagination data
     assert paginated_tasks["page"] == 1
@@ -693,21 +621,20 @@ def test_overdue_tasks(base_url, authenticated_client, tasks_with_due_dates):
     )
     
     assert response.status_code == 200
-    overdue_tasks = json.loads(response.data)
+    overdue_tasks = orjson.loads(response.data)
     
     # Verify we have tasks in the response
     assert len(overdue_tasks["items"]) >= len(tasks_with_due_dates["overdue"])
     
     # Verify all tasks are actually overdue
-    now = datetime.datetime.utcnow()
+    now_iso = datetime.datetime.utcnow().isoformat()
     for task in overdue_tasks["items"]:
         # Skip tasks without due date
         if "dueDate" not in task or not task["dueDate"]:
             continue
         
-        # Parse due date and check if it's in the past
-        due_date = datetime.datetime.fromisoformat(task["dueDate"].replace("Z", "+00:00"))
-        assert due_date < now
+        # Check the due date is in the past
+        assert _utc_iso(task["dueDate"]) < now_iso
         
         # Check task is not completed
         assert task["status"] != "completed"
@@ -722,24 +649,23 @@ def test_due_soon_tasks(base_url, authenticated_client, tasks_with_due_dates):
     )
     
     assert response.status_code == 200
-    due_soon_tasks = json.loads(response.data)
+    due_soon_tasks = orjson.loads(response.data)
     
     # Verify we have tasks in the response
     assert len(due_soon_tasks["items"]) >= 1
     
     # Verify all tasks are due within the next 24 hours
     now = datetime.datetime.utcnow()
-    future_24h = now + datetime.timedelta(hours=24)
+    now_iso = now.isoformat()
+    future_24h_iso = (now + datetime.timedelta(hours=24)).isoformat()
     
     for task in due_soon_tasks["items"]:
         # Skip tasks without due date
         if "dueDate" not in task or not task["dueDate"]:
             continue
             
-        # Parse due date and check if it's within the next 24 hours
-        due_date = datetime.datetime.fromisoformat(task["dueDate"].replace("Z", "+00:00"))
-        assert due_date >= now
-        assert due_date <= future_24h
+        # Check the due date is within the next 24 hours
+        assert now_iso <= _utc_iso(task["dueDate"]) <= future_24h_iso
         
         # Check task is not completed
         assert task["status"] != "completed"
@@ -750,25 +676,23 @@ def test_due_soon_tasks(base_url, authenticated_client, tasks_with_due_dates):
     )
     
     assert custom_response.status_code == 200
-    custom_due_soon = json.loads(custom_response.data)
+    custom_due_soon = orjson.loads(custom_response.data)
     
     # Verify all tasks are due within the next 48 hours
-    future_48h = now + datetime.timedelta(hours=48)
+    future_48h_iso = (now + datetime.timedelta(hours=48)).isoformat()
     
     for task in custom_due_soon["items"]:
         # Skip tasks without due date
         if "dueDate" not in task or not task["dueDate"]:
             continue
             
-        # Parse due date and check if it's within the next 48 hours
-        due_date = datetime.datetime.fromisoformat(task["dueDate"].replace("Z", "+00:00"))
-        assert due_date >= now
-        assert due_date <= future_48h
+        # Check the due date is within the next 48 hours
+        assert now_iso <= _utc_iso(task["dueDate"]) <= future_48h_iso
         
         # Check task is not completed
         assert task["status"] != "completed"
 
-def test_subtask_management(base_url, authenticated_client, test_task):
+def test_subtask_management(authenticated_client, task_url):
     """
     Tests adding, updating, and removing subtasks.
     """
@@ -778,12 +702,12 @@ def test_subtask_management(base_url, authenticated_client, test_task):
     }
     
     response = authenticated_client.post(
-        f"{base_url}/tasks/{test_task['_id']}/subtasks",
+        f"{task_url}/subtasks",
         json=subtask_data
     )
     
     assert response.status_code == 201
-    subtask = json.loads(response.data)
+    subtask = orjson.loads(response.data)
     
     # Verify subtask data
     assert subtask["title"] == subtask_data["title"]
@@ -798,12 +722,12 @@ def test_subtask_management(base_url, authenticated_client, test_task):
     }
     
     response = authenticated_client.post(
-        f"{base_url}/tasks/{test_task['_id']}/subtasks",
+        f"{task_url}/subtasks",
         json=subtask_data2
     )
     
     assert response.status_code == 201
-    subtask2 = json.loads(response.data)
+    subtask2 = orjson.loads(response.data)
     subtask2_id = subtask2["_id"]
     
     # Update first subtask to completed
@@ -812,43 +736,39 @@ def test_subtask_management(base_url, authenticated_client, test_task):
     }
     
     response = authenticated_client.put(
-        f"{base_url}/tasks/{test_task['_id']}/subtasks/{subtask_id}",
+        f"{task_url}/subtasks/{subtask_id}",
         json=update_data
     )
     
     assert response.status_code == 200
-    updated_subtask = json.loads(response.data)
+    updated_subtask = orjson.loads(response.data)
     assert updated_subtask["completed"] is True
     
     # Delete the second subtask
     response = authenticated_client.delete(
-        f"{base_url}/tasks/{test_task['_id']}/subtasks/{subtask2_id}"
+        f"{task_url}/subtasks/{subtask2_id}"
     )
     
     assert response.status_code == 200
     
     # Get task to verify subtasks
     response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
+        task_url
     )
     
     assert response.status_code == 200
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     
-    # Verify the first subtask is present and completed
-    found_subtask = False
-    for st in task["subtasks"]:
-        if st["_id"] == subtask_id:
-            found_subtask = True
-            assert st["completed"] is True
+    subtasks_by_id = {st["_id"]: st for st in task["subtasks"]}
     
-    assert found_subtask
+    # Verify the first subtask is present and completed
+    assert subtask_id in subtasks_by_id
+    assert subtasks_by_id[subtask_id]["completed"] is True
     
     # Verify the second subtask was removed
-    for st in task["subtasks"]:
-        assert st["_id"] != subtask2_id
+    assert subtask2_id not in subtasks_by_id
 
-def test_task_dependencies(base_url, authenticated_client, test_task, second_test_task):
+def test_task_dependencies(base_url, authenticated_client, test_task, task_url, second_test_task):
     """
     Tests managing task dependencies.
     """
@@ -859,23 +779,18 @@ def test_task_dependencies(base_url, authenticated_client, test_task, second_tes
     }
     
     response = authenticated_client.post(
-        f"{base_url}/tasks/{test_task['_id']}/dependencies",
+        f"{task_url}/dependencies",
         json=dependency_data
     )
     
     assert response.status_code == 200
     
-    # Get the task to verify dependency
-    response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
-    )
-    
-    assert response.status_code == 200
-    task = json.loads(response.data)
+    # The response carries the updated task
+    task = orjson.loads(response.data)
     
     # Verify dependency exists
     assert "dependencies" in task
-    assert any(d["taskId"] == second_test_task["_id"] and d["type"] == "blocks" for d in task["dependencies"])
+    assert (second_test_task["_id"], "blocks") in {(d["taskId"], d["type"]) for d in task["dependencies"]}
     
     # Get the second task to verify reverse dependency
     response = authenticated_client.get(
@@ -883,11 +798,11 @@ def test_task_dependencies(base_url, authenticated_client, test_task, second_tes
     )
     
     assert response.status_code == 200
-    second_task = json.loads(response.data)
+    second_task = orjson.loads(response.data)
     
     # Verify reverse dependency exists
     assert "dependencies" in second_task
-    assert any(d["taskId"] == test_task["_id"] and d["type"] == "is-blocked-by" for d in second_task["dependencies"])
+    assert (test_task["_id"], "is-blocked-by") in {(d["taskId"], d["type"]) for d in second_task["dependencies"]}
     
     # Test circular dependency prevention
     # Try to create opposite dependency - should fail
@@ -906,27 +821,27 @@ def test_task_dependencies(base_url, authenticated_client, test_task, second_tes
     
     # Remove the dependency
     response = authenticated_client.delete(
-        f"{base_url}/tasks/{test_task['_id']}/dependencies/{second_test_task['_id']}"
+        f"{task_url}/dependencies/{second_test_task['_id']}"
     )
     
     assert response.status_code == 200
     
     # Verify dependency is removed from both tasks
     response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
+        task_url
     )
     assert response.status_code == 200
-    task = json.loads(response.data)
-    assert not any(d["taskId"] == second_test_task["_id"] for d in task.get("dependencies", []))
+    task = orjson.loads(response.data)
+    assert second_test_task["_id"] not in {d["taskId"] for d in task.get("dependencies", [])}
     
     response = authenticated_client.get(
         f"{base_url}/tasks/{second_test_task['_id']}"
     )
     assert response.status_code == 200
-    second_task = json.loads(response.data)
-    assert not any(d["taskId"] == test_task["_id"] for d in second_task.get("dependencies", []))
+    second_task = orjson.loads(response.data)
+    assert test_task["_id"] not in {d["taskId"] for d in second_task.get("dependencies", [])}
 
-def test_task_attachments(base_url, authenticated_client, test_task, test_file):
+def test_task_attachments(authenticated_client, task_url, test_file):
     """
     Tests adding and removing file attachments.
     """
@@ -937,12 +852,12 @@ def test_task_attachments(base_url, authenticated_client, test_task, test_file):
     }
     
     response = authenticated_client.post(
-        f"{base_url}/tasks/{test_task['_id']}/attachments",
+        f"{task_url}/attachments",
         json=attachment_data
     )
     
     assert response.status_code == 201
-    attachment = json.loads(response.data)
+    attachment = orjson.loads(response.data)
     
     # Verify attachment data
     assert attachment["fileId"] == test_file["_id"]
@@ -950,33 +865,33 @@ def test_task_attachments(base_url, authenticated_client, test_task, test_file):
     
     # Get task to verify attachment
     response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
+        task_url
     )
     
     assert response.status_code == 200
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     
     # Verify attachment exists in task
     assert "attachments" in task
-    assert any(a["fileId"] == test_file["_id"] for a in task["attachments"])
+    assert test_file["_id"] in {a["fileId"] for a in task["attachments"]}
     
     # Remove the attachment
     response = authenticated_client.delete(
-        f"{base_url}/tasks/{test_task['_id']}/attachments/{test_file['_id']}"
+        f"{task_url}/attachments/{test_file['_id']}"
     )
     
     assert response.status_code == 200
     
     # Get task to verify attachment removed
     response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
+        task_url
     )
     
     assert response.status_code == 200
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     
     # Verify attachment is gone
-    assert not any(a["fileId"] == test_file["_id"] for a in task.get("attachments", []))
+    assert test_file["_id"] not in {a["fileId"] for a in task.get("attachments", [])}
 
 def test_search_tasks(base_url, authenticated_client, multiple_user_tasks):
     """
@@ -984,33 +899,34 @@ def test_search_tasks(base_url, authenticated_client, multiple_user_tasks):
     """
     # Search for tasks by keyword
     search_term = "Task"  # Should match most task titles
+    search_pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+    search_url = f"{base_url}/tasks/search"
     
     response = authenticated_client.get(
-        f"{base_url}/tasks/search?q={search_term}"
+        f"{search_url}?q={search_term}"
     )
     
     assert response.status_code == 200
-    search_results = json.loads(response.data)
+    search_results = orjson.loads(response.data)
     
     # Verify we have search results
     assert len(search_results["items"]) > 0
     
     # Verify results contain the search term in title or description
     for task in search_results["items"]:
-        assert (search_term.lower() in task["title"].lower() or 
-                search_term.lower() in task["description"].lower())
+        assert search_pattern.search(task["title"]) or search_pattern.search(task["description"])
     
     # Test search with combined filters
     response = authenticated_client.get(
-        f"{base_url}/tasks/search?q={search_term}&status=in_progress&priority=high"
+        f"{search_url}?q={search_term}&status=in_progress&priority=high"
     )
     
     assert response.status_code == 200
-    filtered_results = json.loads(response.data)
+    filtered_results = orjson.loads(response.data)
     
     # Verify results match all criteria
     for task in filtered_results["items"]:
-        assert search_term.lower() in task["title"].lower() or search_term.lower() in task["description"].lower()
+        assert search_pattern.search(task["title"]) or search_pattern.search(task["description"])
         assert task["status"] == "in_progress"
         assert task["priority"] == "high"
     
@@ -1018,27 +934,27 @@ def test_search_tasks(base_url, authenticated_client, multiple_user_tasks):
     project_id = multiple_user_tasks[0]["projectId"]
     if project_id:
         response = authenticated_client.get(
-            f"{base_url}/tasks/search?projectId={project_id}"
+            f"{search_url}?projectId={project_id}"
         )
         
         assert response.status_code == 200
-        project_results = json.loads(response.data)
+        project_results = orjson.loads(response.data)
         
         # Verify results are from the specified project
         for task in project_results["items"]:
             assert task["projectId"] == project_id
 
-def test_task_deletion(base_url, authenticated_client, test_task):
+def test_task_deletion(authenticated_client, task_url):
     """
     Tests task deletion.
     """
     # Delete the task
     response = authenticated_client.delete(
-        f"{base_url}/tasks/{test_task['_id']}"
+        task_url
     )
     
     assert response.status_code == 200
-    result = json.loads(response.data)
+    result = orjson.loads(response.data)
     
     # Verify success message
     assert "success" in result
@@ -1046,14 +962,14 @@ def test_task_deletion(base_url, authenticated_client, test_task):
     
     # Try to get the deleted task
     response = authenticated_client.get(
-        f"{base_url}/tasks/{test_task['_id']}"
+        task_url
     )
     
     # Should return not found (404) or indicate the task is deleted
     assert response.status_code in [404, 200]
     
     if response.status_code == 200:
-        task = json.loads(response.data)
+        task = orjson.loads(response.data)
         assert task.get("status") == "deleted" or task.get("isDeleted") is True
 
 def test_complete_task_workflow(base_url, authenticated_client, test_project, another_user):
@@ -1074,8 +990,11 @@ def test_complete_task_workflow(base_url, authenticated_client, test_project, an
     )
     
     assert response.status_code == 201
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     task_id = task["_id"]
+    task_url = f"{base_url}/tasks/{task_id}"
+    status_url = f"{task_url}/status"
+    subtasks_url = f"{task_url}/subtasks"
     
     # Verify initial task status
     assert task["status"] == "created"
@@ -1086,12 +1005,12 @@ def test_complete_task_workflow(base_url, authenticated_client, test_project, an
     }
     
     response = authenticated_client.patch(
-        f"{base_url}/tasks/{task_id}/assign",
+        f"{task_url}/assign",
         json=assign_data
     )
     
     assert response.status_code == 200
-    updated_task = json.loads(response.data)
+    updated_task = orjson.loads(response.data)
     
     # Verify task is assigned and status updated
     assert updated_task["assigneeId"] == another_user["_id"]
@@ -1103,12 +1022,12 @@ def test_complete_task_workflow(base_url, authenticated_client, test_project, an
     }
     
     response = authenticated_client.patch(
-        f"{base_url}/tasks/{task_id}/status",
+        status_url,
         json=status_data
     )
     
     assert response.status_code == 200
-    updated_task = json.loads(response.data)
+    updated_task = orjson.loads(response.data)
     assert updated_task["status"] == "in_progress"
     
     # Step 4: Add subtasks
@@ -1118,20 +1037,18 @@ def test_complete_task_workflow(base_url, authenticated_client, test_project, an
         {"title": "Workflow Subtask 3"}
     ]
     
-    subtask_ids = []
-    for subtask_data in subtasks:
-        response = authenticated_client.post(
-            f"{base_url}/tasks/{task_id}/subtasks",
-            json=subtask_data
-        )
-        
-        assert response.status_code == 201
-        subtask = json.loads(response.data)
-        subtask_ids.append(subtask["_id"])
+    response = authenticated_client.post(
+        f"{subtasks_url}/bulk",
+        json={"subtasks": subtasks}
+    )
+    
+    assert response.status_code == 201
+    subtask_ids = [subtask["_id"] for subtask in orjson.loads(response.data)]
+    assert len(subtask_ids) == len(subtasks)
     
     # Step 5: Complete first subtask
     response = authenticated_client.put(
-        f"{base_url}/tasks/{task_id}/subtasks/{subtask_ids[0]}",
+        f"{subtasks_url}/{subtask_ids[0]}",
         json={"completed": True}
     )
     
@@ -1139,47 +1056,42 @@ def test_complete_task_workflow(base_url, authenticated_client, test_project, an
     
     # Get task to check completion percentage
     response = authenticated_client.get(
-        f"{base_url}/tasks/{task_id}"
+        task_url
     )
     
     assert response.status_code == 200
-    task = json.loads(response.data)
+    task = orjson.loads(response.data)
     
     # Verify one of three subtasks is completed
-    completed_count = sum(1 for s in task["subtasks"] if s["completed"])
-    assert completed_count == 1
+    assert task["subtaskStats"] == {"total": 3, "completed": 1}
     
     # Step 6: Move task to review
     response = authenticated_client.patch(
-        f"{base_url}/tasks/{task_id}/status",
+        status_url,
         json={"status": "in_review"}
     )
     
     assert response.status_code == 200
-    updated_task = json.loads(response.data)
+    updated_task = orjson.loads(response.data)
     assert updated_task["status"] == "in_review"
     
     # Step 7: Complete the task
     response = authenticated_client.patch(
-        f"{base_url}/tasks/{task_id}/status",
+        status_url,
         json={"status": "completed"}
     )
     
     assert response.status_code == 200
-    completed_task = json.loads(response.data)
+    completed_task = orjson.loads(response.data)
     
     # Verify task is completed
     assert completed_task["status"] == "completed"
     assert "completedAt" in completed_task["metadata"]
     
-    # Verify task appears in completed tasks list
+    # Verify the completed status was persisted
     response = authenticated_client.get(
-        f"{base_url}/tasks?status=completed"
+        task_url
     )
     
     assert response.status_code == 200
-    completed_tasks = json.loads(response.data)
-    
-    # Find our task in the completed tasks
-    task_found = any(t["_id"] == task_id for t in completed_tasks["items"])
-    assert task_found
\ No newline at end of file
+    assert orjson.loads(response.data)["status"] == "completed"
\ No newline at end of file
@@ -1,11 +1,74 @@
-from locust import HttpUser, task, tag, between
-import json
+from locust import HttpUser, task, tag, between, events
+from locust.runners import MasterRunner
+import orjson
+import os
 import random
+import requests
+import secrets
 import time
+from requests.adapters import HTTPAdapter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Base URL for API endpoints
 API_BASE_URL = '/api/v1'
+TASKS_URL = f'{API_BASE_URL}/tasks'
+PROJECTS_URL = f'{API_BASE_URL}/projects'
+
+# Values picked from by the random data generators
+TASK_STATUSES = ("created", "assigned", "in-progress", "on-hold", "in-review", "completed")
+TASK_PRIORITIES = ("low", "medium", "high", "urgent")
+PROJECT_STATUSES = ("planning", "active", "on-hold", "completed")
+# Statuses an existing task is moved to by TaskUser.update_task
+UPDATE_TASK_STATUSES = ("in-progress", "on-hold", "in-review", "completed")
+
+# Pause between status changes in CombinedUser.complete_task_flow, in seconds.
+# Set LOCUST_SIMULATE_THINK=0 for stress and endurance runs so users keep generating load.
+SIMULATE_THINK_TIME = os.environ.get('LOCUST_SIMULATE_THINK', '1') == '1'
+THINK_TIME_RANGE = (1, 2)
+
+# Simulated users share a pool of accounts registered once at test start.
+# Set LOCUST_REUSE_ACCOUNTS=0 to have every user register and log in its own account.
+REUSE_ACCOUNTS = os.environ.get('LOCUST_REUSE_ACCOUNTS', '1') == '1'
+ACCOUNT_POOL_SIZE = int(os.environ.get('LOCUST_ACCOUNT_POOL_SIZE', '200'))
+# Concurrent provisioning requests; Locust runs under gevent, so these are cheap greenlets
+# and large pools can raise it to register accounts faster
+ACCOUNT_POOL_WORKERS = int(os.environ.get('LOCUST_ACCOUNT_POOL_WORKERS', '20'))
+
+# Most recent task/project IDs each user remembers for updates and lookups,
+# so per-user state stays bounded during endurance runs
+MAX_TRACKED_IDS = 256
+
+# Accounts provisioned by on_test_start, each with user data and a JWT token
+_ACCOUNT_POOL = []
+
+def _loads(response):
+    """
+    Decode a JSON response body with orjson
+    
+    Args:
+        response (Response): HTTP response with a JSON body
+        
+    Returns:
+        dict: Decoded response data
+    """
+    return orjson.loads(response.content)
+
+def _check_status(response, expected_status):
+    """
+    Mark a catch_response request as passed or failed from its status code alone
+    
+    Read-only tasks never inspect the body, so it is not decoded just to validate the call.
+    
+    Args:
+        response (ResponseContextManager): Response opened with catch_response=True
+        expected_status (int): Status code that counts as success
+    """
+    if response.status_code == expected_status:
+        response.success()
+    else:
+        response.failure(f"Unexpected status code {response.status_code}")
 
 def generate_random_user():
     """
@@ -14,8 +77,8 @@ def generate_random_user():
     Returns:
         dict: Random user data with email, password, first_name, last_name
     """
-    timestamp = int(time.time())
-    email = f"testuser_{timestamp}_{random.randint(1000, 9999)}@example.com"
+    # Random hex rather than a timestamp, so concurrent users and Locust workers never collide
+    email = f"testuser_{secrets.token_hex(6)}@example.com"
     password = "Test123456!"  # Use a standard password for testing
     first_name = f"Test{random.randint(100, 999)}"
     last_name = f"User{random.randint(100, 999)}"
@@ -37,15 +100,11 @@ def generate_random_task(project_id=None):
     Returns:
         dict: Random task data with title, description, status, priority, due_date
     """
-    timestamp = int(time.time())
-    statuses = ["created", "assigned", "in-progress", "on-hold", "in-review", "completed"]
-    priorities = ["low", "medium", "high", "urgent"]
-    
     task_data = {
-        "title": f"Test Task {timestamp}_{random.randint(1000, 9999)}",
-        "description": f"This is a test task created for performance testing at {datetime.now().isoformat()}",
-        "status": random.choice(statuses),
-        "priority": random.choice(priorities),
+        "title": f"Test Task {time.monotonic_ns()}",
+        "description": "This is a test task created for performance testing",
+        "status": random.choice(TASK_STATUSES),
+        "priority": random.choice(TASK_PRIORITIES),
         "due_date": (datetime.now() + timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d")
     }
     
@@ -61,15 +120,59 @@ def generate_random_project():
     Returns:
         dict: Random project data with name, description, status
     """
-    timestamp = int(time.time())
-    statuses = ["planning", "active", "on-hold", "completed"]
-    
     return {
-        "name": f"Test Project {timestamp}_{random.randint(1000, 9999)}",
-        "description": f"This is a test project created for performance testing at {datetime.now().isoformat()}",
-        "status": random.choice(statuses)
+        "name": f"Test Project {time.monotonic_ns()}",
+        "description": "This is a test project created for performance testing",
+        "status": random.choice(PROJECT_STATUSES)
     }
 
+def _provision_account(session, host):
+    """
+    Register and log in a new account outside of the measured workload
+    
+    Args:
+        session (requests.Session): Shared session used for provisioning
+        host (str): Base host URL of the system under test
+        
+    Returns:
+        dict: Account with user data and token, or None if provisioning failed
+    """
+    user_data = generate_random_user()
+    
+    session.post(f"{host}{API_BASE_URL}/auth/register", data=orjson.dumps(user_data))
+    response = session.post(
+        f"{host}{API_BASE_URL}/auth/login",
+        data=orjson.dumps({"email": user_data["email"], "password": user_data["password"]})
+    )
+    
+    if response.status_code != 200:
+        return None
+    token = _loads(response).get("token")
+    return {"user_data": user_data, "token": token} if token else None
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """
+    Provision the shared account pool before simulated users start
+    
+    Args:
+        environment (Environment): Locust environment of the test run
+    """
+    # In distributed runs only the workers spawn users, so the master skips provisioning
+    if not REUSE_ACCOUNTS or isinstance(environment.runner, MasterRunner):
+        return
+    
+    # One keep-alive connection per provisioning thread instead of a new one per request
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=ACCOUNT_POOL_WORKERS))
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=ACCOUNT_POOL_WORKERS))
+    
+    _ACCOUNT_POOL.clear()
+    with session, ThreadPoolExecutor(max_workers=ACCOUNT_POOL_WORKERS) as executor:
+        accounts = list(executor.map(lambda _: _provision_account(session, environment.host), range(ACCOUNT_POOL_SIZE)))
+    _ACCOUNT_POOL.extend(account for account in accounts if account)
+
 class BaseUser(HttpUser):
     """
     Base user class with common functionality for all user types
@@ -82,6 +185,8 @@ class BaseUser(HttpUser):
         super().__init__(*args, **kwargs)
         self.auth_token = None
         self.user_data = {}
+        # Request bodies are encoded with orjson and sent as raw data
+        self.client.headers.update({"Content-Type": "application/json"})
     
     def login(self, credentials):
         """
@@ -95,12 +200,12 @@ class BaseUser(HttpUser):
         """
         response = self.client.post(
             f"{API_BASE_URL}/auth/login",
-            json=credentials,
+            data=orjson.dumps(credentials),
             name="Login"
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             if "token" in data:
                 self.auth_token = data["token"]
                 self.client.headers.update({"Authorization": f"Bearer {self.auth_token}"})
@@ -122,7 +227,7 @@ class BaseUser(HttpUser):
             
         response = self.client.post(
             f"{API_BASE_URL}/auth/register",
-            json=user_data,
+            data=orjson.dumps(user_data),
             name="Register New User"
         )
         
@@ -132,6 +237,14 @@ class BaseUser(HttpUser):
         """
         Actions to perform when user starts
         """
+        # Reuse a pre-provisioned account when available
+        if REUSE_ACCOUNTS and _ACCOUNT_POOL:
+            account = random.choice(_ACCOUNT_POOL)
+            self.user_data = account["user_data"]
+            self.auth_token = account["token"]
+            self.client.headers.update({"Authorization": f"Bearer {self.auth_token}"})
+            return
+        
         # Generate user data and register
         self.user_data = generate_random_user()
         register_response, _ = self.register(self.user_data)
@@ -152,14 +265,14 @@ class TaskUser(BaseUser):
         Initialize the task user
         """
         super().__init__(*args, **kwargs)
-        self.task_ids = []
+        self.task_ids = deque(maxlen=MAX_TRACKED_IDS)
     
     def on_start(self):
         """
         Actions to perform when user starts
         """
         super().on_start()
-        self.task_ids = []
+        self.task_ids = deque(maxlen=MAX_TRACKED_IDS)
     
     @task(3)
     @tag('task')
@@ -173,13 +286,13 @@ class TaskUser(BaseUser):
         task_data = generate_random_task()
         
         response = self.client.post(
-            f"{API_BASE_URL}/tasks",
-            json=task_data,
+            TASKS_URL,
+            data=orjson.dumps(task_data),
             name="Create Task"
         )
         
         if response.status_code == 201:
-            task_id = response.json().get("id")
+            task_id = _loads(response).get("id")
             if task_id:
                 self.task_ids.append(task_id)
         
@@ -194,10 +307,12 @@ class TaskUser(BaseUser):
         Returns:
             dict: Task list data
         """
-        response = self.client.get(
-            f"{API_BASE_URL}/tasks",
-            name="Get Task List"
-        )
+        with self.client.get(
+            TASKS_URL,
+            name="Get Task List",
+            catch_response=True
+        ) as response:
+            _check_status(response, 200)
         
         return response
     
@@ -214,17 +329,15 @@ class TaskUser(BaseUser):
             return None
             
         task_id = random.choice(self.task_ids)
-        statuses = ["in-progress", "on-hold", "in-review", "completed"]
-        priorities = ["low", "medium", "high", "urgent"]
         
         update_data = {
-            "status": random.choice(statuses),
-            "priority": random.choice(priorities)
+            "status": random.choice(UPDATE_TASK_STATUSES),
+            "priority": random.choice(TASK_PRIORITIES)
         }
         
         response = self.client.put(
-            f"{API_BASE_URL}/tasks/{task_id}",
-            json=update_data,
+            f"{TASKS_URL}/{task_id}",
+            data=orjson.dumps(update_data),
             name="Update Task"
         )
         
@@ -245,7 +358,7 @@ class TaskUser(BaseUser):
         task_id = random.choice(self.task_ids)
         
         response = self.client.get(
-            f"{API_BASE_URL}/tasks/{task_id}",
+            f"{TASKS_URL}/{task_id}",
             name="Get Task Detail"
         )
         
@@ -261,14 +374,14 @@ class ProjectUser(BaseUser):
         Initialize the project user
         """
         super().__init__(*args, **kwargs)
-        self.project_ids = []
+        self.project_ids = deque(maxlen=MAX_TRACKED_IDS)
     
     def on_start(self):
         """
         Actions to perform when user starts
         """
         super().on_start()
-        self.project_ids = []
+        self.project_ids = deque(maxlen=MAX_TRACKED_IDS)
     
     @task(3)
     @tag('project')
@@ -282,13 +395,13 @@ class ProjectUser(BaseUser):
         project_data = generate_random_project()
         
         response = self.client.post(
-            f"{API_BASE_URL}/projects",
-            json=project_data,
+            PROJECTS_URL,
+            data=orjson.dumps(project_data),
             name="Create Project"
         )
         
         if response.status_code == 201:
-            project_id = response.json().get("id")
+            project_id = _loads(response).get("id")
             if project_id:
                 self.project_ids.append(project_id)
         
@@ -303,10 +416,12 @@ class ProjectUser(BaseUser):
         Returns:
             dict: Project list data
         """
-        response = self.client.get(
-            f"{API_BASE_URL}/projects",
-            name="Get Project List"
-        )
+        with self.client.get(
+            PROJECTS_URL,
+            name="Get Project List",
+            catch_response=True
+        ) as response:
+            _check_status(response, 200)
         
         return response
     
@@ -323,16 +438,15 @@ class ProjectUser(BaseUser):
             return None
             
         project_id = random.choice(self.project_ids)
-        statuses = ["planning", "active", "on-hold", "completed"]
         
         update_data = {
-            "name": f"Updated Project {int(time.time())}_{random.randint(1000, 9999)}",
-            "status": random.choice(statuses)
+            "name": f"Updated Project {time.monotonic_ns()}",
+            "status": random.choice(PROJECT_STATUSES)
         }
         
         response = self.client.put(
-            f"{API_BASE_URL}/projects/{project_id}",
-            json=update_data,
+            f"{PROJECTS_URL}/{project_id}",
+            data=orjson.dumps(update_data),
             name="Update Project"
         )
         
@@ -353,7 +467,7 @@ class ProjectUser(BaseUser):
         project_id = random.choice(self.project_ids)
         
         response = self.client.get(
-            f"{API_BASE_URL}/projects/{project_id}",
+            f"{PROJECTS_URL}/{project_id}",
             name="Get Project Detail"
         )
         
@@ -370,16 +484,16 @@ class CombinedUser(BaseUser):
         Initialize the combined user
         """
         super().__init__(*args, **kwargs)
-        self.task_ids = []
-        self.project_ids = []
+        self.task_ids = deque(maxlen=MAX_TRACKED_IDS)
+        self.project_ids = deque(maxlen=MAX_TRACKED_IDS)
     
     def on_start(self):
         """
         Actions to perform when user starts
         """
         super().on_start()
-        self.task_ids = []
-        self.project_ids = []
+        self.task_ids = deque(maxlen=MAX_TRACKED_IDS)
+        self.project_ids = deque(maxlen=MAX_TRACKED_IDS)
     
     @task(2)
     @tag('combined')
@@ -393,16 +507,17 @@ class CombinedUser(BaseUser):
         # Create project
         project_data = generate_random_project()
         project_response = self.client.post(
-            f"{API_BASE_URL}/projects",
-            json=project_data,
+            PROJECTS_URL,
+            data=orjson.dumps(project_data),
             name="Create Project with Tasks - Project Creation"
         )
         
-        result = {"project": project_response.json() if project_response.status_code == 201 else None}
+        project = _loads(project_response) if project_response.status_code == 201 else None
+        result = {"project": project}
         task_results = []
         
-        if project_response.status_code == 201:
-            project_id = project_response.json().get("id")
+        if project:
+            project_id = project.get("id")
             if project_id:
                 self.project_ids.append(project_id)
                 
@@ -411,16 +526,17 @@ class CombinedUser(BaseUser):
                 for _ in range(num_tasks):
                     task_data = generate_random_task(project_id)
                     task_response = self.client.post(
-                        f"{API_BASE_URL}/tasks",
-                        json=task_data,
+                        TASKS_URL,
+                        data=orjson.dumps(task_data),
                         name="Create Project with Tasks - Task Creation"
                     )
                     
                     if task_response.status_code == 201:
-                        task_id = task_response.json().get("id")
+                        created_task = _loads(task_response)
+                        task_id = created_task.get("id")
                         if task_id:
                             self.task_ids.append(task_id)
-                            task_results.append(task_response.json())
+                            task_results.append(created_task)
         
         result["tasks"] = task_results
         return result
@@ -434,10 +550,12 @@ class CombinedUser(BaseUser):
         Returns:
             dict: Dashboard data
         """
-        response = self.client.get(
+        with self.client.get(
             f"{API_BASE_URL}/dashboard",
-            name="Get Dashboard Data"
-        )
+            name="Get Dashboard Data",
+            catch_response=True
+        ) as response:
+            _check_status(response, 200)
         
         return response
     
@@ -453,15 +571,16 @@ class CombinedUser(BaseUser):
         # Create a new task
         task_data = generate_random_task()
         task_response = self.client.post(
-            f"{API_BASE_URL}/tasks",
-            json=task_data,
+            TASKS_URL,
+            data=orjson.dumps(task_data),
             name="Complete Task Flow - Task Creation"
         )
         
-        result = {"creation": task_response.json() if task_response.status_code == 201 else None}
+        created_task = _loads(task_response) if task_response.status_code == 201 else None
+        result = {"creation": created_task}
         
-        if task_response.status_code == 201:
-            task_id = task_response.json().get("id")
+        if created_task:
+            task_id = created_task.get("id")
             if task_id:
                 self.task_ids.append(task_id)
                 
@@ -470,31 +589,32 @@ class CombinedUser(BaseUser):
                     "status": "in-progress"
                 }
                 progress_response = self.client.put(
-                    f"{API_BASE_URL}/tasks/{task_id}",
-                    json=progress_update,
+                    f"{TASKS_URL}/{task_id}",
+                    data=orjson.dumps(progress_update),
                     name="Complete Task Flow - Set In Progress"
                 )
-                result["in_progress"] = progress_response.json() if progress_response.status_code == 200 else None
+                result["in_progress"] = _loads(progress_response) if progress_response.status_code == 200 else None
                 
-                # Wait for a short time to simulate work
-                time.sleep(random.uniform(1, 2))
+                # Wait for a short time to simulate work, unless think time is disabled
+                if SIMULATE_THINK_TIME:
+                    time.sleep(random.uniform(*THINK_TIME_RANGE))
                 
                 # Update to completed
                 completion_update = {
                     "status": "completed"
                 }
                 completion_response = self.client.put(
-                    f"{API_BASE_URL}/tasks/{task_id}",
-                    json=completion_update,
+                    f"{TASKS_URL}/{task_id}",
+                    data=orjson.dumps(completion_update),
                     name="Complete Task Flow - Set Completed"
                 )
-                result["completed"] = completion_response.json() if completion_response.status_code == 200 else None
+                result["completed"] = _loads(completion_response) if completion_response.status_code == 200 else None
                 
                 # Verify task status
                 verification_response = self.client.get(
-                    f"{API_BASE_URL}/tasks/{task_id}",
+                    f"{TASKS_URL}/{task_id}",
                     name="Complete Task Flow - Verify Completion"
                 )
-                result["verification"] = verification_response.json() if verification_response.status_code == 200 else None
+                result["verification"] = _loads(verification_response) if verification_response.status_code == 200 else None
         
         return result
\ No newline at end of file